@@ -65,7 +65,7 @@ from src.vectordb.qdrant_store import qdrant_healthcheck, get_qdrant_local_clien
 from src.ingestion.validators import validate_filename, validate_size, ALLOWED_EXTENSIONS
 from src.storage.blob_store import save_upload_bytes
 from src.ingestion.ingest_rag import ingest_file_to_qdrant, COLLECTION_NAME
-from src.agents.crew_runner import run_pipeline
+from src.agents.crew_runner import iter_pipeline_batch
 from src.db.results_store import append_legal_result, append_financial_result
 from src.db.deals_store import load_deals
 from src.db.results_store import already_processed
@@ -257,23 +257,29 @@ with colA:
                 st.warning("No PDFs found under storage/blobs for this deal. Upload PDFs first.")
                 st.stop()
 
+            pending = []
             for d in docs:
                 if already_processed(deal_id, d["original_name"]):
                     st.info(f"Skipping already processed: {d['original_name']}")
                     continue
 
-                from src.extractors.pdf_text import extract_pdf_text
-                from src.extractors.docx_text import extract_docx_text
-                from src.extractors.pptx_text import extract_pptx_text
-                from src.extractors.tabular_text import extract_csv_text, extract_xlsx_text
                 text = extract_any_text(d["stored_path"])
                 if not text.strip():
                     st.error(f"No text extracted (OCR step later): {d['original_name']}")
                     continue
+                pending.append((d, text))
+
+            # Each document is shown and saved as soon as it finishes, so a later failure or a
+            # closed tab does not lose the ones already done
+            progress = st.progress(0.0, text=f"Running CrewAI on {len(pending)} document(s)")
+            batch = iter_pipeline_batch([(d["original_name"], text) for d, text in pending])
+            for done, (i, res) in enumerate(batch, 1):
+                d, text = pending[i]
+                progress.progress(done / len(pending), text=f"CrewAI finished {done}/{len(pending)}: {d['original_name']}")
+                if isinstance(res, Exception):
+                    st.error(f"CrewAI failed for {d['original_name']}: {res}")
+                    continue
 
-                with st.spinner(f"Running CrewAI on: {d['original_name']}"):
-                    res = run_pipeline(d["original_name"], text)
-                
                 # Display completeness analysis results with document-type-aware scoring
                 if res.completeness:
                     comp = res.completeness
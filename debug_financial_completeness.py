@@ -46,9 +46,10 @@ def compare_financial_files():
             print(f"📄 Extracted {len(text)} characters")
             
             # Analyze each component separately for debugging
-            statements = analyzer._analyze_financial_statements(text)
-            performance = analyzer._analyze_performance_metrics(text)
-            periods = analyzer._analyze_period_evidence(text)
+            text_lower = text.lower()
+            statements = analyzer._analyze_financial_statements(text_lower)
+            performance = analyzer._analyze_performance_metrics(text_lower)
+            periods = analyzer._analyze_period_evidence(text, text_lower)
             numeric = analyzer._analyze_numeric_evidence(text)
             
             print(f"\n📋 STATEMENTS:")
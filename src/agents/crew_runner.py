@@ -1,19 +1,52 @@
 from __future__ import annotations
 
-import json
+import atexit
+import hashlib
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Any, Dict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Tuple, Type, TypeVar
 
-from crewai import Agent, Task, Crew, Process  # type: ignore
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
-from src.agents.llm_factory import get_llm_id
+from src.agents._crew_hot import (
+    SPREADSHEET_EXTS,
+    _file_ext,
+    _safe_parse_json,
+    heuristic_doc_type,
+)
+from src.agents.llm_factory import get_llm
 from src.agents.schemas import RouterDecision, LegalRiskFinding, FinancialAnomalyFinding
-from src.agents.deal_completeness_analyzer import DealCompletenessAnalyzer
-from src.agents.deal_completeness_schema import DealCompletenessAnalysis
-from src.agents.financial_completeness_analyzer import FinancialCompletenessAnalyzer
-from src.agents.financial_completeness_schema import FinancialCompletenessAnalysis
+from src.core.settings import get_settings
 from src.tools.prompts import ROUTER_PROMPT, LEGAL_PROMPT, FIN_PROMPT
 
+if TYPE_CHECKING:
+    from src.agents.deal_completeness_schema import DealCompletenessAnalysis
+    from src.agents.financial_completeness_schema import FinancialCompletenessAnalysis
+
+M = TypeVar("M", bound=BaseModel)
+
+# The static instruction prompts go into the agent backstory (system message) so every
+# request starts with an identical prefix the LLM server can serve from its prompt/KV cache;
+# only the per-document tail below varies between calls.
+ROUTER_BACKSTORY = "You route documents for a due diligence copilot system.\n\n" + ROUTER_PROMPT
+LEGAL_BACKSTORY = "Careful due diligence analyst. Use only provided text.\n\n" + LEGAL_PROMPT
+FIN_BACKSTORY = "Financial diligence analyst for statements/schedules.\n\n" + FIN_PROMPT
+
+ROUTER_TEMPLATE = "FILENAME:\n{fn}\n\nEXCERPT:\n{body}"
+LEGAL_TEMPLATE = "FILENAME:\n{fn}\n\nTEXT:\n{body}"
+FIN_TEMPLATE = "FILENAME:\n{fn}\n\nTEXT:\n{body}"
+
+LLM_TEXT_CHARS = 12000
+
+@lru_cache(maxsize=1)
+def _crewai():
+    """Imports crewai on first use so routing/parsing helpers stay cheap to import."""
+    from crewai import Agent, Task, Crew, Process  # type: ignore
+    return Agent, Task, Crew, Process
+
 @dataclass(frozen=True)
 class CrewResults:
     router: RouterDecision
@@ -22,153 +55,119 @@ class CrewResults:
     completeness: DealCompletenessAnalysis | None = None
     financial_completeness: FinancialCompletenessAnalysis | None = None
 
-def _safe_parse_json(s: str) -> Dict[str, Any]:
-    import re
-    
-    # Clean the string first
-    s = s.strip()
-    
-    # Remove or escape invalid control characters
-    # Keep only valid control characters (tab, newline, carriage return)
-    s = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', s)
-    
-    # Fix common JSON formatting issues
-    s = re.sub(r'[\r\n]+', ' ', s)  # Replace newlines with spaces
-    s = re.sub(r'\s+', ' ', s)  # Collapse multiple spaces
-    
-    # Find JSON boundaries
-    start = s.find("{")
-    end = s.rfind("}")
+# Per-schema validators built once; validate_json fuses JSON parsing and validation in pydantic-core
+_ADAPTERS: Dict[type, TypeAdapter] = {
+    RouterDecision: TypeAdapter(RouterDecision),
+    LegalRiskFinding: TypeAdapter(LegalRiskFinding),
+    FinancialAnomalyFinding: TypeAdapter(FinancialAnomalyFinding),
+}
+
+def _validate(raw: str, ta: TypeAdapter) -> Any:
+    """Slices the outermost {...} from the model output and validates it in one pass."""
+    buf = raw.encode("utf-8", errors="replace")
+    start = buf.find(b"{")
+    end = buf.rfind(b"}")
     if start == -1 or end == -1 or end <= start:
-        raise ValueError(f"Could not find JSON in model output: {s[:250]}")
-    
-    json_str = s[start:end+1]
-    
+        raise ValueError(f"Could not find JSON in model output: {raw[:250]}")
+    return ta.validate_json(buf[start:end+1])
+
+def _parse_output(out: Any, model: Type[M]) -> M:
+    """
+    Validates crew output against `model`.
+    The raw output is validated directly, which is all it takes when structured output
+    constrains the LLM to the schema; output that fails validation (structured output off,
+    or a server ignoring the response format) falls back to the tolerant `_safe_parse_json`
+    recovery path.
+    """
+    raw = str(out)
+    ta = _ADAPTERS.get(model) or TypeAdapter(model)
     try:
-        return json.loads(json_str)
-    except json.JSONDecodeError as e:
-        # Try to fix common JSON issues
-        try:
-            # Fix unescaped quotes in strings
-            fixed_json = re.sub(r'(?<!\\)"(?![,\]}:])', r'\"', json_str)
-            return json.loads(fixed_json)
-        except json.JSONDecodeError:
-            # Last resort: try to extract key-value pairs manually
-            try:
-                # Simple fallback for basic JSON objects
-                fallback_data = {}
-                
-                # Extract risk_level
-                risk_match = re.search(r'"risk_level"\s*:\s*"([^"]*)"', json_str)
-                if risk_match:
-                    fallback_data["risk_level"] = risk_match.group(1)
-                else:
-                    fallback_data["risk_level"] = "Medium"  # default
-                
-                # Extract red_flags
-                flags_match = re.search(r'"red_flags"\s*:\s*\[(.*?)\]', json_str, re.DOTALL)
-                if flags_match:
-                    flags_str = flags_match.group(1)
-                    # Simple extraction of quoted strings
-                    flags = re.findall(r'"([^"]*)"', flags_str)
-                    fallback_data["red_flags"] = flags[:5]  # limit to 5
-                else:
-                    fallback_data["red_flags"] = []
-                
-                # Extract clauses
-                clauses_match = re.search(r'"clauses"\s*:\s*\[(.*?)\]', json_str, re.DOTALL)
-                if clauses_match:
-                    clauses_str = clauses_match.group(1)
-                    clauses = re.findall(r'"([^"]*)"', clauses_str)
-                    fallback_data["clauses"] = clauses[:5]  # limit to 5
-                else:
-                    fallback_data["clauses"] = []
-                
-                # Extract rationale
-                rationale_match = re.search(r'"rationale"\s*:\s*"([^"]*)"', json_str)
-                if rationale_match:
-                    fallback_data["rationale"] = rationale_match.group(1)
-                else:
-                    fallback_data["rationale"] = "Analysis completed with parsing issues"
-                
-                return fallback_data
-                
-            except Exception:
-                # Ultimate fallback
-                return {
-                    "risk_level": "Medium",
-                    "red_flags": ["JSON parsing error occurred"],
-                    "clauses": [],
-                    "rationale": f"Failed to parse LLM response due to JSON formatting issues. Raw output: {json_str[:200]}..."
-                }
-
-def heuristic_doc_type(filename: str, text: str) -> str | None:
-    fn = filename.lower()
-    t = (text[:8000] or "").lower()
-    
-    # Step 1: Detect file extension first for financial spreadsheets
-    from pathlib import Path
-    ext = Path(filename).suffix.lower()
-    if ext in ['.xlsx', '.xls', '.csv']:
-        return "financial"  # Always treat spreadsheets as financial
-
-    # Treat M&A/legal analysis PDFs as legal pipeline for MVP
-    legal_kw = [
-        "merger", "m&a", "acquisition", "scheme of arrangement", "terms of merger",
-        "nclt", "cci", "sebi", "regulatory", "consent", "termination", "change of control",
-        "exclusivity", "non-compete", "indemnity", "penalty", "governing law",
-        "confidentiality", "cross-border merger",
-    ]
-    if any(k in fn for k in ["m&a", "merger", "reliance", "disney", "uniliver", "unilever", "pvr", "inox", "vodafone"]) or any(k in t for k in legal_kw):
-        return "contract"
-
-    fin_kw = ["income statement", "balance sheet", "cash flow", "ebitda", "net income", "revenue", "cogs"]
-    if any(k in fn for k in ["income", "balance", "cashflow", "financial"]) or any(k in t for k in fin_kw):
-        return "financial"
-
-    return None
+        return _validate(raw, ta)
+    except ValidationError:
+        return model(**_safe_parse_json(raw))
 
-def run_router(filename: str, excerpt: str) -> RouterDecision:
-    llm_id = get_llm_id()
+_local = threading.local()
+
+def _cached_crew(name: str, build: Callable[[], Tuple[Any, Any]]) -> Tuple[Any, Any]:
+    """
+    Returns this thread's (task, crew) for one agent role, building it on first use.
+    Agent construction dominates per-call setup, so the graph is fixed and only the task
+    description varies between kickoffs. Kept per thread because agents and tasks carry
+    per-run state while batches kick off concurrently.
+    """
+    crews: Dict[str, Tuple[Any, Any]] = _local.__dict__.setdefault("crews", {})
+    pair = crews.get(name)
+    if pair is None:
+        pair = crews[name] = build()
+    return pair
+
+def _build_router_crew() -> Tuple[Any, Any]:
+    Agent, Task, Crew, Process = _crewai()
     router = Agent(
         role="Router Agent",
         goal="Classify dataroom documents into correct doc_type for downstream pipelines.",
-        backstory="You route documents for a due diligence copilot system.",
-        llm=llm_id,
+        backstory=ROUTER_BACKSTORY,
+        llm=get_llm(RouterDecision),
         allow_delegation=False,
         verbose=False,
     )
     task = Task(
-        description=f"{ROUTER_PROMPT}\n\nFILENAME:\n{filename}\n\nEXCERPT:\n{excerpt}",
+        description=ROUTER_TEMPLATE,
         expected_output='STRICT JSON like {"doc_type":"contract","rationale":"..."}',
         agent=router,
     )
     crew = Crew(agents=[router], tasks=[task], process=Process.sequential, verbose=False, tracing=False)
-    out = crew.kickoff()
-    data = _safe_parse_json(str(out))
-    return RouterDecision(**data)
+    return task, crew
 
-def run_legal(filename: str, text: str) -> LegalRiskFinding:
-    llm_id = get_llm_id()
+def _build_legal_crew() -> Tuple[Any, Any]:
+    Agent, Task, Crew, Process = _crewai()
     a = Agent(
         role="Legal Risk Agent",
         goal="Extract key legal risks and rate risk level.",
-        backstory="Careful due diligence analyst. Use only provided text.",
-        llm=llm_id,
+        backstory=LEGAL_BACKSTORY,
+        llm=get_llm(LegalRiskFinding),
         allow_delegation=False,
         verbose=False,
     )
     task = Task(
-        description=f"{LEGAL_PROMPT}\n\nFILENAME:\n{filename}\n\nTEXT:\n{text[:12000]}",
+        description=LEGAL_TEMPLATE,
         expected_output="STRICT JSON with risk_level, red_flags, clauses, rationale.",
         agent=a,
     )
     crew = Crew(agents=[a], tasks=[task], process=Process.sequential, verbose=False, tracing=False)
+    return task, crew
+
+def _build_financial_crew() -> Tuple[Any, Any]:
+    Agent, Task, Crew, Process = _crewai()
+    a = Agent(
+        role="Financial Analysis Agent",
+        goal="Extract key metrics and flag anomalies (MVP).",
+        backstory=FIN_BACKSTORY,
+        llm=get_llm(FinancialAnomalyFinding),
+        allow_delegation=False,
+        verbose=False,
+    )
+    task = Task(
+        description=FIN_TEMPLATE,
+        expected_output="STRICT JSON with anomalies, key_metrics, rationale.",
+        agent=a,
+    )
+    crew = Crew(agents=[a], tasks=[task], process=Process.sequential, verbose=False, tracing=False)
+    return task, crew
+
+def run_router(filename: str, excerpt: str) -> RouterDecision:
+    task, crew = _cached_crew("router", _build_router_crew)
+    task.description = ROUTER_TEMPLATE.format_map({"fn": filename, "body": excerpt})
+    out = crew.kickoff()
+    return _parse_output(out, RouterDecision)
+
+def run_legal(filename: str, text: str) -> LegalRiskFinding:
+    task, crew = _cached_crew("legal", _build_legal_crew)
+    task.description = LEGAL_TEMPLATE.format_map({"fn": filename, "body": text[:LLM_TEXT_CHARS]})
     
     try:
         out = crew.kickoff()
-        parsed_data = _safe_parse_json(str(out))
-        return LegalRiskFinding(**parsed_data)
+        return _parse_output(out, LegalRiskFinding)
     except Exception as e:
         print(f"Warning: Legal analysis failed for {filename}: {e}")
         # Return a safe fallback result
@@ -180,38 +179,32 @@ def run_legal(filename: str, text: str) -> LegalRiskFinding:
         )
 
 def run_financial(filename: str, text: str) -> FinancialAnomalyFinding:
-    llm_id = get_llm_id()
-    a = Agent(
-        role="Financial Analysis Agent",
-        goal="Extract key metrics and flag anomalies (MVP).",
-        backstory="Financial diligence analyst for statements/schedules.",
-        llm=llm_id,
-        allow_delegation=False,
-        verbose=False,
-    )
-    task = Task(
-        description=f"{FIN_PROMPT}\n\nFILENAME:\n{filename}\n\nTEXT:\n{text[:12000]}",
-        expected_output="STRICT JSON with anomalies, key_metrics, rationale.",
-        agent=a,
-    )
-    crew = Crew(agents=[a], tasks=[task], process=Process.sequential, verbose=False, tracing=False)
+    task, crew = _cached_crew("financial", _build_financial_crew)
+    task.description = FIN_TEMPLATE.format_map({"fn": filename, "body": text[:LLM_TEXT_CHARS]})
     out = crew.kickoff()
-    return FinancialAnomalyFinding(**_safe_parse_json(str(out)))
+    return _parse_output(out, FinancialAnomalyFinding)
 
-def run_pipeline(filename: str, full_text: str) -> CrewResults:
+def run_pipeline(filename: str, full_text: str, llm_dedup: _LLMDedup | None = None) -> CrewResults:
     """
     Enhanced pipeline with document-type-aware completeness validation.
     Uses different validation rules for legal vs financial documents.
+    `llm_dedup` lets a batch share legal/financial LLM calls between identical texts.
     """
+    def _llm(fn: Callable[[str, str], M]) -> M:
+        if llm_dedup is None:
+            return fn(filename, full_text)
+        return llm_dedup.call(fn, filename, full_text)
+
+    from src.agents.deal_completeness_analyzer import DealCompletenessAnalyzer
+    from src.agents.financial_completeness_analyzer import analyze_document as analyze_financial_document
+
     # First, determine document type for completeness analysis
-    from pathlib import Path
-    ext = Path(filename).suffix.lower()
+    ext = _file_ext(filename)
     
     # Step 2: Use document-type-aware completeness analysis
-    if ext in ['.xlsx', '.xls', '.csv']:
+    if ext in SPREADSHEET_EXTS:
         # Financial spreadsheet - use financial completeness rules
-        financial_analyzer = FinancialCompletenessAnalyzer()
-        financial_completeness = financial_analyzer.analyze_document(filename, full_text)
+        financial_completeness = analyze_financial_document(filename, full_text)
         
         # Check financial document completeness
         if financial_completeness.scores.classification == "reject_incomplete":
@@ -229,7 +222,7 @@ def run_pipeline(filename: str, full_text: str) -> CrewResults:
         # Process as financial document
         return CrewResults(
             router=RouterDecision(doc_type="financial", rationale="Financial spreadsheet - heuristic route"), 
-            financial=run_financial(filename, full_text),
+            financial=_llm(run_financial),
             financial_completeness=financial_completeness
         )
     
@@ -239,7 +232,7 @@ def run_pipeline(filename: str, full_text: str) -> CrewResults:
         completeness_analysis = analyzer.analyze_document(filename, full_text)
         
         # Check legal document completeness (but allow financial documents through)
-        h = heuristic_doc_type(filename, full_text)
+        h = heuristic_doc_type(filename, full_text, ext)
         
         # Skip legal completeness check for financial documents
         if h != "financial" and completeness_analysis.scores.classification == "reject_incomplete":
@@ -255,7 +248,7 @@ def run_pipeline(filename: str, full_text: str) -> CrewResults:
         
         # Continue with existing logic for legal/contract documents
         if h == "contract":
-            legal_result = run_legal(filename, full_text)
+            legal_result = _llm(run_legal)
             
             # Apply completeness constraints to legal analysis (only for legal docs)
             if completeness_analysis.scores.classification == "reject_incomplete":
@@ -270,19 +263,18 @@ def run_pipeline(filename: str, full_text: str) -> CrewResults:
         
         if h == "financial":
             # For financial PDFs, use financial completeness analysis
-            financial_analyzer = FinancialCompletenessAnalyzer()
-            financial_completeness = financial_analyzer.analyze_document(filename, full_text)
+            financial_completeness = analyze_financial_document(filename, full_text)
             
             return CrewResults(
                 router=RouterDecision(doc_type="financial", rationale="Heuristic route"), 
-                financial=run_financial(filename, full_text),
+                financial=_llm(run_financial),
                 financial_completeness=financial_completeness
             )
 
         # Fallback to LLM router
         router_decision = run_router(filename, full_text[:2500])
         if router_decision.doc_type == "contract":
-            legal_result = run_legal(filename, full_text)
+            legal_result = _llm(run_legal)
             
             # Apply completeness constraints
             if completeness_analysis.scores.classification == "reject_incomplete":
@@ -297,13 +289,109 @@ def run_pipeline(filename: str, full_text: str) -> CrewResults:
         
         if router_decision.doc_type == "financial":
             # For financial documents routed by LLM, use financial completeness
-            financial_analyzer = FinancialCompletenessAnalyzer()
-            financial_completeness = financial_analyzer.analyze_document(filename, full_text)
+            financial_completeness = analyze_financial_document(filename, full_text)
             
             return CrewResults(
                 router=router_decision, 
-                financial=run_financial(filename, full_text),
+                financial=_llm(run_financial),
                 financial_completeness=financial_completeness
             )
         
         return CrewResults(router=router_decision, completeness=completeness_analysis)
+
+class _LLMDedup:
+    """
+    Batch-scoped memo for legal/financial LLM calls keyed on the filename and a digest of the
+    truncated text, which together make up the prompt. Re-uploads of the same file then cost one
+    call; concurrent callers of the same key wait on the first one's future.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._futures: Dict[Tuple[str, str, bytes], Future] = {}
+
+    def call(self, fn: Callable[[str, str], M], filename: str, full_text: str) -> M:
+        digest = hashlib.blake2b(
+            full_text[:LLM_TEXT_CHARS].encode("utf-8", "replace"), digest_size=16
+        ).digest()
+        key = (fn.__name__, filename, digest)
+        with self._lock:
+            fut = self._futures.get(key)
+            owner = fut is None
+            if owner:
+                fut = self._futures[key] = Future()
+        if owner:
+            try:
+                fut.set_result(fn(filename, full_text))
+            except BaseException as e:
+                # Forget the failure so a retried pipeline (e.g. after HTTP 429) calls the LLM again
+                with self._lock:
+                    del self._futures[key]
+                fut.set_exception(e)
+                raise
+        # Callers may amend the finding (e.g. incomplete-document flags), so hand out copies
+        return fut.result().model_copy(deep=True)
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Process-wide pool for crew calls; LLM requests are I/O bound so threads overlap them."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=get_settings().crew_concurrency, thread_name_prefix="crew"
+            )
+            atexit.register(_executor.shutdown, wait=False, cancel_futures=True)
+        return _executor
+
+def _is_rate_limited(e: Exception) -> bool:
+    # litellm/openai raise RateLimitError and carry status_code; requests' HTTPError carries the response
+    if "ratelimit" in type(e).__name__.lower():
+        return True
+    status = getattr(e, "status_code", None)
+    if status is None:
+        status = getattr(getattr(e, "response", None), "status_code", None)
+    return status == 429
+
+def _with_retry(fn: Callable[..., Any], *args: Any, retries: int = 3, backoff_s: float = 1.0) -> Any:
+    """Call fn, retrying with exponential backoff when the LLM server rate-limits (HTTP 429)."""
+    for attempt in range(retries + 1):
+        try:
+            return fn(*args)
+        except Exception as e:
+            if attempt == retries or not _is_rate_limited(e):
+                raise
+            time.sleep(backoff_s * (2 ** attempt))
+
+def iter_pipeline_batch(items: List[Tuple[str, str]]) -> Iterator[Tuple[int, CrewResults | Exception]]:
+    """
+    Runs `run_pipeline` for many (filename, full_text) documents concurrently and yields
+    (index into `items`, result) as each document finishes; identical texts share their LLM calls.
+    A document that fails yields its exception, so the others still come through.
+    """
+    if len(items) <= 1:
+        for i, (filename, text) in enumerate(items):
+            try:
+                yield i, _with_retry(run_pipeline, filename, text)
+            except Exception as e:
+                yield i, e
+        return
+
+    dedup = _LLMDedup()
+    executor = _get_executor()
+    futures = {
+        executor.submit(_with_retry, run_pipeline, filename, text, dedup): i
+        for i, (filename, text) in enumerate(items)
+    }
+    for fut in as_completed(futures):
+        exc = fut.exception()
+        yield futures[fut], exc if exc is not None else fut.result()
+
+def run_pipeline_batch(items: List[Tuple[str, str]]) -> List[CrewResults | Exception | None]:
+    """`iter_pipeline_batch` collected into a list in the same order as `items`."""
+    results: List[CrewResults | Exception | None] = [None] * len(items)
+    for i, res in iter_pipeline_batch(items):
+        results[i] = res
+    return results
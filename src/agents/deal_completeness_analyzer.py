@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import atexit
+import hashlib
 import re
-from typing import Dict, List, Tuple
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 from src.agents.deal_completeness_schema import (
     DealCompletenessAnalysis, DocumentMetadata, Entities, EntityInfo,
     DealInfo, PriceAndPayment, RepsAndWarranties, RepTopics,
@@ -10,6 +17,246 @@ from src.agents.deal_completeness_schema import (
     CapitalAndDebt, Tax, Compliance
 )
 
+try:
+    import ahocorasick  # optional: one-pass multi-keyword matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2 as _re  # optional: linear-time DFA matching
+except ImportError:
+    _re = re
+
+@lru_cache(maxsize=8)
+def _build_keyword_automaton(keywords: Tuple[str, ...]):
+    """
+    One read-only automaton per keyword vocabulary, shared by every analyzer instance
+    (the pipeline creates a fresh analyzer per document). None without pyahocorasick.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+# re2 re-encodes a str subject to UTF-8 on every search, so with re2 the patterns are
+# compiled as bytes and each document is encoded once; stdlib re keeps working on str
+_BYTES_SUBJECT = _re is not re
+
+def _compile(pattern: str, ignorecase: bool = False):
+    """Compile with re2 when available; flags are inline because re2 has no flag constants."""
+    pattern = ("(?i)" if ignorecase else "") + pattern
+    return _re.compile(pattern.encode("utf-8") if _BYTES_SUBJECT else pattern)
+
+def _subject(text: str) -> str | bytes:
+    """The form of `text` the compiled patterns search."""
+    return text.encode("utf-8", "replace") if _BYTES_SUBJECT else text
+
+def _text(value: str | bytes) -> str:
+    return value.decode("utf-8", "replace") if isinstance(value, bytes) else value
+
+def _compile_any(patterns: Tuple[str, ...], ignorecase: bool = False):
+    """Compile a pattern list into one alternation so all of it is tested in a single pass."""
+    return _compile("|".join(f"(?:{p})" for p in patterns), ignorecase)
+
+# Documents at least this long overlap their regex-bound analyzers on a thread pool
+PARALLEL_MIN_CHARS = 50_000
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Process-wide pool shared by all analyzer instances."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="deal-analyzer")
+            atexit.register(_executor.shutdown, wait=False, cancel_futures=True)
+        return _executor
+
+# Recent analyze_document results keyed by (text digest, filename, page_count)
+ANALYSIS_CACHE_SIZE = 256
+_analysis_cache: OrderedDict[Tuple[bytes, str, int], DealCompletenessAnalysis] = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+# Core regex patterns (strong anti-bypass signals)
+_DEFINED_TERM_PATTERNS = (
+    r'"[A-Za-z0-9 ,.-]{2,40}"\s+(means|shall mean)',
+    r'\b(defined terms|definitions)\b'
+)
+
+_SCHEDULE_PATTERNS = (
+    r'\b(schedule|exhibit|annex|appendix)\s+([A-Z]|\d+)(\.\d+)?\b',
+    r'\bdisclosure schedule(s)?\b'
+)
+
+_CURRENCY_PATTERNS = (
+    r'\b(USD|SGD|EUR|GBP|INR|AUD|JPY|CNY)\b',
+    r'\b(\$|S\$|€|£)\s?\d'
+)
+
+_DATE_PATTERNS = (
+    r'\b\d{1,2}\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\s+\d{4}\b',
+    r'\b\d{4}-\d{2}-\d{2}\b'
+)
+
+_PERCENTAGE_PATTERNS = (
+    r'\b\d+(\.\d+)?%\b',
+)
+
+# Compiled once at import instead of on every search
+_DEFINED_TERM_RE = _compile_any(_DEFINED_TERM_PATTERNS, ignorecase=True)
+_SCHEDULE_RE = _compile_any(_SCHEDULE_PATTERNS, ignorecase=True)
+_CURRENCY_RE = _compile_any(_CURRENCY_PATTERNS, ignorecase=True)
+_DATE_RE = _compile_any(_DATE_PATTERNS)
+_DATE_RES = tuple(_compile(p) for p in _DATE_PATTERNS)
+_PERCENTAGE_RE = _compile_any(_PERCENTAGE_PATTERNS)
+_GOVERNING_LAW_RE = _compile(r'governed?\s+by\s+(?:the\s+)?laws?\s+of\s+([A-Za-z\s]+)', ignorecase=True)
+_NUMBER_RE = _compile(r'\d')
+# The date, percentage, defined-term and schedule signals as one alternation, each in a
+# named group with its own case sensitivity, so re2 can look for all four in one pass
+_EVIDENCE_RE = _compile(
+    '(?P<date>' + '|'.join(f'(?:{p})' for p in _DATE_PATTERNS) + ')'
+    '|(?P<pct>' + '|'.join(f'(?:{p})' for p in _PERCENTAGE_PATTERNS) + ')'
+    '|(?i:(?P<defined>' + '|'.join(f'(?:{p})' for p in _DEFINED_TERM_PATTERNS) + '))'
+    '|(?i:(?P<schedule>' + '|'.join(f'(?:{p})' for p in _SCHEDULE_PATTERNS) + '))'
+)
+# Company names ending in a corporate suffix, one pattern per suffix family so a name
+# that one pattern consumes can still be found by the other; the bounded body keeps
+# matching linear
+_ENTITY_RES = (
+    _compile(r'([A-Z][A-Za-z\s&]{1,80}(?:Inc|LLC|Ltd|Corp|Corporation|Limited|Company)\.?)'),
+    _compile(r'([A-Z][A-Za-z\s&]{1,80}(?:Holdings|Group|Partners|Capital|Ventures))'),
+)
+# Per term: the term followed within 100 characters by a day-month-year date, or any ISO
+# date anywhere (the alternation is not grouped, as in the original per-call pattern)
+_CLOSING_DATE_RES = tuple(
+    _compile(f'(?s){term}.{{0,100}}?' + '|'.join(_DATE_PATTERNS), ignorecase=True)
+    for term in ("closing", "completion")
+)
+
+# Decision tables, first matching rule wins: (terms, also match document text, doc_type_guess)
+_DOC_TYPE_RULES = (
+    (("teaser", "overview", "executive summary", "information memorandum", "cim"), True, "teaser"),
+    (("loi", "letter of intent", "term sheet", "heads of terms", "memorandum of understanding", "mou"), True, "loi"),
+    (("term sheet",), True, "term_sheet"),
+    (("spa", "sale", "purchase", "agreement"), False, "spa"),
+    (("apa", "asset"), False, "apa"),
+    (("merger", "scheme of arrangement"), True, "msa"),
+    (("confidentiality", "non-disclosure", "nda"), True, "nda"),
+    (("financial", "statement", "audit"), False, "financials"),
+)
+
+# (terms, deal structure)
+_STRUCTURE_RULES = (
+    (("asset purchase", "asset sale"), "asset_purchase"),
+    (("share purchase", "stock purchase", "equity purchase"), "share_purchase"),
+    (("merger",), "merger"),
+    (("scheme of arrangement",), "scheme"),
+    (("tender offer",), "tender_offer"),
+)
+
+# Comprehensive bucket keyword lists
+_BUCKET_KEYWORDS = MappingProxyType({
+    'deal_identity': (
+        'buyer', 'purchaser', 'acquirer', 'seller', 'vendor', 'target', 'acquired company',
+        'transaction', 'acquisition', 'merger', 'asset purchase', 'share purchase', 
+        'stock purchase', 'merger agreement', 'signing date', 'closing date', 
+        'effective date', 'governing law', 'jurisdiction', 'venue', 'forum'
+    ),
+    'price_payment': (
+        'purchase price', 'consideration', 'enterprise value', 'equity value',
+        'working capital', 'net debt', 'cash-free debt-free', 'adjustment', 'true-up',
+        'closing statement', 'earn-out', 'milestone payment', 'escrow', 'holdback',
+        'retention amount', 'cash consideration', 'stock consideration', 'exchange ratio'
+    ),
+    'reps_warranties': (
+        'representations and warranties', 'reps and warranties', 'disclosure schedule',
+        'disclosure schedules', 'materiality', 'material adverse effect', 'MAE', 'MAC',
+        'knowledge qualifier', 'to the knowledge of', 'authority', 'organisation',
+        'capitalization', 'financial statements', 'undisclosed liabilities',
+        'compliance with laws', 'tax matters', 'employment', 'benefits',
+        'intellectual property', 'IP', 'infringement', 'material contracts',
+        'litigation', 'investigation', 'environmental', 'anti-corruption',
+        'sanctions', 'AML', 'data protection', 'privacy'
+    ),
+    'covenants': (
+        'covenants', 'ordinary course', 'negative covenant', 'access to information',
+        'due diligence', 'employee matters', 'retention', 'non-compete', 'non-solicit',
+        'confidentiality', 'transition services', 'TSA'
+    ),
+    'closing_conditions': (
+        'conditions to closing', 'closing conditions', 'CPs', 'regulatory approval',
+        'clearance', 'third party consent', 'board approval', 'shareholder approval',
+        'no injunction', 'bring-down', 'deliverables', 'closing deliverables'
+    ),
+    'termination_remedies': (
+        'termination', 'terminate', 'outside date', 'long stop date', 'drop dead date',
+        'break fee', 'reverse break fee', 'specific performance', 'remedies'
+    ),
+    'indemnities_limits': (
+        'indemnification', 'indemnity', 'survival period', 'basket', 'deductible',
+        'tipping basket', 'cap', 'limitation of liability', 'escrow claims',
+        'fraud carve-out', 'willful misconduct', 'representation and warranty insurance',
+        'RWI'
+    ),
+    'financials': (
+        'income statement', 'profit and loss', 'P&L', 'balance sheet', 'cash flow statement',
+        'audited', 'unaudited', 'IFRS', 'US GAAP', 'SSFRS', 'EBITDA', 'adjusted EBITDA',
+        'revenue recognition', 'forecast', 'projections', 'budget', 'quality of earnings', 'QoE'
+    ),
+    'capital_debt': (
+        'cap table', 'capitalization table', 'options', 'warrants', 'convertibles',
+        'SAFE', 'preference shares', 'credit facility', 'loan agreement', 'debt',
+        'lien', 'charge', 'pledge', 'security interest', 'mortgage', 'default',
+        'covenant breach', 'waiver', 'payoff letter', 'release of liens'
+    ),
+    'tax': (
+        'tax returns', 'tax audit', 'assessment', 'withholding tax', 'VAT', 'GST',
+        'transfer pricing', 'tax indemnity', 'tax covenant'
+    ),
+    'litigation_claims': (
+        'litigation', 'lawsuit', 'claim', 'dispute', 'allegation', 'accusations',
+        'complaint', 'demand letter', 'cease and desist', 'investigation', 'inquiry',
+        'subpoena', 'settlement', 'consent order', 'injunction', 'contingent liability',
+        'provision', 'reserve', 'whistleblower', 'internal investigation',
+        'arbitration', 'mediation'
+    ),
+    'compliance': (
+        'anti-bribery', 'anti-corruption', 'FCPA', 'UK bribery act', 'AML', 'KYC',
+        'sanctions', 'OFAC', 'antitrust', 'competition law', 'PDPA', 'GDPR',
+        'data protection', 'privacy', 'cybersecurity', 'data breach', 'export controls',
+        'health and safety', 'environmental'
+    )
+})
+
+# Every bucket keyword, lowercased, matched in one pass over the text
+_ALL_KEYWORDS = tuple(dict.fromkeys(
+    kw.lower() for keywords in _BUCKET_KEYWORDS.values() for kw in keywords
+))
+
+# Lowercased per-bucket keywords, in list order, for hit-table lookups
+_BUCKET_KEYWORDS_LOWER = MappingProxyType({
+    bucket: tuple(kw.lower() for kw in keywords) for bucket, keywords in _BUCKET_KEYWORDS.items()
+})
+
+# Other lowercase phrases the analyzers probe for, located in the same pass
+_PROBE_TERMS = (
+    'teaser', 'overview', 'executive summary', 'information memorandum', 'cim', 'loi',
+    'letter of intent', 'term sheet', 'heads of terms', 'memorandum of understanding',
+    'mou', 'scheme of arrangement', 'non-disclosure', 'nda', 'asset sale',
+    'equity purchase', 'tender offer', 'completion date', 'governed by',
+    'closing adjustment', 'earnout', 'capitalisation', 'undisclosed liabilit', 'tax',
+    'return', 'third-party consent', 'bring down', 'survival', 'maximum',
+    'reps and warranties insurance', 'accounting standard', 'accounting principle',
+    'period', 'year ended', 'quarter ended'
+)
+
+# Vocabulary of the one-pass scan: bucket keywords first, then probe terms
+_SCAN_TERMS = tuple(dict.fromkeys(_ALL_KEYWORDS + _PROBE_TERMS))
+
 class DealCompletenessAnalyzer:
     """
     Analyzes deal documents for completeness using the comprehensive schema.
@@ -17,173 +264,130 @@ class DealCompletenessAnalyzer:
     """
     
     def __init__(self):
-        # Core regex patterns (strong anti-bypass signals)
-        self.defined_term_patterns = [
-            r'"[A-Za-z0-9 ,.-]{2,40}"\s+(means|shall mean)',
-            r'\b(defined terms|definitions)\b'
-        ]
-        
-        self.schedule_patterns = [
-            r'\b(schedule|exhibit|annex|appendix)\s+([A-Z]|\d+)(\.\d+)?\b',
-            r'\bdisclosure schedule(s)?\b'
-        ]
+        # Module-level constants are shared by every instance; construction only binds them
+        self.defined_term_patterns = _DEFINED_TERM_PATTERNS
+        self.schedule_patterns = _SCHEDULE_PATTERNS
+        self.currency_patterns = _CURRENCY_PATTERNS
+        self.date_patterns = _DATE_PATTERNS
+        self.percentage_patterns = _PERCENTAGE_PATTERNS
+        self.bucket_keywords = _BUCKET_KEYWORDS
+        
+        self._defined_term_re = _DEFINED_TERM_RE
+        self._schedule_re = _SCHEDULE_RE
+        self._currency_re = _CURRENCY_RE
+        self._date_re = _DATE_RE
+        self._date_res = _DATE_RES
+        self._percentage_re = _PERCENTAGE_RE
+        self._governing_law_re = _GOVERNING_LAW_RE
+        self._number_re = _NUMBER_RE
+        self._evidence_re = _EVIDENCE_RE
+        self._closing_date_res = _CLOSING_DATE_RES
+        self._entity_res = _ENTITY_RES
+        
+        self._all_keywords = _ALL_KEYWORDS
+        self._keyword_automaton = _build_keyword_automaton(_SCAN_TERMS)
+
+    def analyze_document(self, filename: str, text: str, page_count: int = 0) -> DealCompletenessAnalysis:
+        """Perform comprehensive analysis of a deal document."""
         
-        self.currency_patterns = [
-            r'\b(USD|SGD|EUR|GBP|INR|AUD|JPY|CNY)\b',
-            r'\b(\$|S\$|€|£)\s?\d'
-        ]
+        # Reruns and later pipeline stages re-analyze the same document; serve those from cache
+        key = (hashlib.blake2b(text.encode("utf-8", "replace"), digest_size=16).digest(), filename, page_count)
+        with _analysis_cache_lock:
+            cached = _analysis_cache.get(key)
+            if cached is not None:
+                _analysis_cache.move_to_end(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
         
-        self.date_patterns = [
-            r'\b\d{1,2}\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\s+\d{4}\b',
-            r'\b\d{4}-\d{2}-\d{2}\b'
-        ]
+        # Lowercase and locate all bucket keywords once; every analyzer below shares them
+        text_lower = text.lower()
+        analysis = self._analyze(filename, text, text_lower, self._keyword_hits(text_lower), page_count)
         
-        self.percentage_patterns = [
-            r'\b\d+(\.\d+)?%\b'
+        # Cache a private copy so callers are free to modify what they get back
+        with _analysis_cache_lock:
+            _analysis_cache[key] = analysis.model_copy(deep=True)
+            while len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+                _analysis_cache.popitem(last=False)
+        return analysis
+
+    def analyze_batch(self, docs: List[Tuple[str, str, int]]) -> List[DealCompletenessAnalysis]:
+        """Analyze many (filename, text, page_count) documents with one keyword pass over the batch."""
+        lowers = [text.lower() for _, text, _ in docs]
+        hits_per_doc = self._keyword_hits_batch(lowers)
+        return [
+            self._analyze(filename, text, text_lower, hits, page_count)
+            for (filename, text, page_count), text_lower, hits in zip(docs, lowers, hits_per_doc)
         ]
-        
-        # Comprehensive bucket keyword lists
-        self.bucket_keywords = {
-            'deal_identity': [
-                'buyer', 'purchaser', 'acquirer', 'seller', 'vendor', 'target', 'acquired company',
-                'transaction', 'acquisition', 'merger', 'asset purchase', 'share purchase', 
-                'stock purchase', 'merger agreement', 'signing date', 'closing date', 
-                'effective date', 'governing law', 'jurisdiction', 'venue', 'forum'
-            ],
-            'price_payment': [
-                'purchase price', 'consideration', 'enterprise value', 'equity value',
-                'working capital', 'net debt', 'cash-free debt-free', 'adjustment', 'true-up',
-                'closing statement', 'earn-out', 'milestone payment', 'escrow', 'holdback',
-                'retention amount', 'cash consideration', 'stock consideration', 'exchange ratio'
-            ],
-            'reps_warranties': [
-                'representations and warranties', 'reps and warranties', 'disclosure schedule',
-                'disclosure schedules', 'materiality', 'material adverse effect', 'MAE', 'MAC',
-                'knowledge qualifier', 'to the knowledge of', 'authority', 'organisation',
-                'capitalization', 'financial statements', 'undisclosed liabilities',
-                'compliance with laws', 'tax matters', 'employment', 'benefits',
-                'intellectual property', 'IP', 'infringement', 'material contracts',
-                'litigation', 'investigation', 'environmental', 'anti-corruption',
-                'sanctions', 'AML', 'data protection', 'privacy'
-            ],
-            'covenants': [
-                'covenants', 'ordinary course', 'negative covenant', 'access to information',
-                'due diligence', 'employee matters', 'retention', 'non-compete', 'non-solicit',
-                'confidentiality', 'transition services', 'TSA'
-            ],
-            'closing_conditions': [
-                'conditions to closing', 'closing conditions', 'CPs', 'regulatory approval',
-                'clearance', 'third party consent', 'board approval', 'shareholder approval',
-                'no injunction', 'bring-down', 'deliverables', 'closing deliverables'
-            ],
-            'termination_remedies': [
-                'termination', 'terminate', 'outside date', 'long stop date', 'drop dead date',
-                'break fee', 'reverse break fee', 'specific performance', 'remedies'
-            ],
-            'indemnities_limits': [
-                'indemnification', 'indemnity', 'survival period', 'basket', 'deductible',
-                'tipping basket', 'cap', 'limitation of liability', 'escrow claims',
-                'fraud carve-out', 'willful misconduct', 'representation and warranty insurance',
-                'RWI'
-            ],
-            'financials': [
-                'income statement', 'profit and loss', 'P&L', 'balance sheet', 'cash flow statement',
-                'audited', 'unaudited', 'IFRS', 'US GAAP', 'SSFRS', 'EBITDA', 'adjusted EBITDA',
-                'revenue recognition', 'forecast', 'projections', 'budget', 'quality of earnings', 'QoE'
-            ],
-            'capital_debt': [
-                'cap table', 'capitalization table', 'options', 'warrants', 'convertibles',
-                'SAFE', 'preference shares', 'credit facility', 'loan agreement', 'debt',
-                'lien', 'charge', 'pledge', 'security interest', 'mortgage', 'default',
-                'covenant breach', 'waiver', 'payoff letter', 'release of liens'
-            ],
-            'tax': [
-                'tax returns', 'tax audit', 'assessment', 'withholding tax', 'VAT', 'GST',
-                'transfer pricing', 'tax indemnity', 'tax covenant'
-            ],
-            'litigation_claims': [
-                'litigation', 'lawsuit', 'claim', 'dispute', 'allegation', 'accusations',
-                'complaint', 'demand letter', 'cease and desist', 'investigation', 'inquiry',
-                'subpoena', 'settlement', 'consent order', 'injunction', 'contingent liability',
-                'provision', 'reserve', 'whistleblower', 'internal investigation',
-                'arbitration', 'mediation'
-            ],
-            'compliance': [
-                'anti-bribery', 'anti-corruption', 'FCPA', 'UK bribery act', 'AML', 'KYC',
-                'sanctions', 'OFAC', 'antitrust', 'competition law', 'PDPA', 'GDPR',
-                'data protection', 'privacy', 'cybersecurity', 'data breach', 'export controls',
-                'health and safety', 'environmental'
-            ]
-        }
 
-    def analyze_document(self, filename: str, text: str, page_count: int = 0) -> DealCompletenessAnalysis:
-        """Perform comprehensive analysis of a deal document."""
+    def _analyze(self, filename: str, text: str, text_lower: str, hits: Dict[str, int],
+                 page_count: int) -> DealCompletenessAnalysis:
+        """Run every analyzer given the document's lowercased text and keyword hits."""
+        
+        # On large documents the regex-bound analyzers run on the shared pool while the
+        # hit-table analyzers run here; re2 releases the GIL while matching, stdlib re does not
+        subject = _subject(text)
+        deal_future = evidence_future = None
+        if _re is not re and len(text) >= PARALLEL_MIN_CHARS:
+            pool = _get_executor()
+            deal_future = pool.submit(self._analyze_deal_info, subject, hits)
+            evidence_future = pool.submit(self._analyze_evidence_strength, subject)
         
         # Initialize the analysis
         analysis = DealCompletenessAnalysis(
-            doc_meta=self._analyze_document_metadata(filename, text, page_count)
+            doc_meta=self._analyze_document_metadata(filename, hits, page_count)
         )
         
         # Extract entities
-        analysis.entities = self._extract_entities(text)
+        analysis.entities = self._extract_entities(subject)
         
         # Analyze deal structure and terms
-        analysis.deal = self._analyze_deal_info(text)
+        analysis.deal = deal_future.result() if deal_future else self._analyze_deal_info(subject, hits)
         
         # Analyze financial aspects
-        analysis.price_and_payment = self._analyze_price_and_payment(text)
-        analysis.financials = self._analyze_financials(text)
+        analysis.price_and_payment = self._analyze_price_and_payment(text, text_lower, hits, subject)
+        analysis.financials = self._analyze_financials(text, text_lower, hits)
         
         # Analyze legal aspects
-        analysis.reps_and_warranties = self._analyze_reps_warranties(text)
-        analysis.closing_conditions = self._analyze_closing_conditions(text)
-        analysis.indemnities_and_limits = self._analyze_indemnities(text)
-        analysis.litigation_and_allegations = self._analyze_litigation(text)
+        analysis.reps_and_warranties = self._analyze_reps_warranties(text, text_lower, hits)
+        analysis.closing_conditions = self._analyze_closing_conditions(text, text_lower, hits)
+        analysis.indemnities_and_limits = self._analyze_indemnities(text, text_lower, hits)
+        analysis.litigation_and_allegations = self._analyze_litigation(text, text_lower, hits)
         
         # Analyze evidence strength
-        analysis.evidence_strength = self._analyze_evidence_strength(text)
+        analysis.evidence_strength = (
+            evidence_future.result() if evidence_future else self._analyze_evidence_strength(subject)
+        )
         
-        # Analyze additional buckets for comprehensive coverage
-        analysis.covenants = self._analyze_covenants(text)
-        analysis.capital_and_debt = self._analyze_capital_debt(text)
-        analysis.tax = self._analyze_tax(text)
-        analysis.compliance = self._analyze_compliance(text)
+        # Analyze additional buckets for comprehensive coverage. These only look for their
+        # own bucket keywords, so with none present the all-False defaults are the result.
+        if self._bucket_has_hits('covenants', hits):
+            analysis.covenants = self._analyze_covenants(text, text_lower, hits)
+        if self._bucket_has_hits('capital_debt', hits):
+            analysis.capital_and_debt = self._analyze_capital_debt(text, text_lower, hits)
+        if self._bucket_has_hits('tax', hits):
+            analysis.tax = self._analyze_tax(text, text_lower, hits)
+        if self._bucket_has_hits('compliance', hits):
+            analysis.compliance = self._analyze_compliance(text, text_lower, hits)
         
         # Validate completeness and calculate scores
         analysis.validate_completeness()
         
         return analysis
 
-    def _analyze_document_metadata(self, filename: str, text: str, page_count: int) -> DocumentMetadata:
+    def _analyze_document_metadata(self, filename: str, hits: Dict[str, int], page_count: int) -> DocumentMetadata:
         """Analyze document metadata and classify document type."""
         
         filename_lower = filename.lower()
-        text_lower = text.lower()
         
         # Enhanced document type guessing with teaser/LOI detection
         doc_type_guess = "other"
         
         # Priority order: check for specific document types first
-        if any(term in filename_lower or term in text_lower for term in [
-            "teaser", "overview", "executive summary", "information memorandum", "cim"
-        ]):
-            doc_type_guess = "teaser"
-        elif any(term in filename_lower or term in text_lower for term in [
-            "loi", "letter of intent", "term sheet", "heads of terms", "memorandum of understanding", "mou"
-        ]):
-            doc_type_guess = "loi"
-        elif "term sheet" in filename_lower or "term sheet" in text_lower:
-            doc_type_guess = "term_sheet"
-        elif any(term in filename_lower for term in ["spa", "sale", "purchase", "agreement"]):
-            doc_type_guess = "spa"
-        elif any(term in filename_lower for term in ["apa", "asset"]):
-            doc_type_guess = "apa"
-        elif any(term in filename_lower or term in text_lower for term in ["merger", "scheme of arrangement"]):
-            doc_type_guess = "msa"
-        elif any(term in filename_lower or term in text_lower for term in ["confidentiality", "non-disclosure", "nda"]):
-            doc_type_guess = "nda"
-        elif any(term in filename_lower for term in ["financial", "statement", "audit"]):
-            doc_type_guess = "financials"
+        doc_type_guess = next(
+            (label for terms, check_text, label in _DOC_TYPE_RULES
+             if any(term in filename_lower or (check_text and term in hits) for term in terms)),
+            doc_type_guess,
+        )
         
         # Determine source type
         source = "pdf"  # Default assumption
@@ -200,23 +404,22 @@ class DealCompletenessAnalyzer:
             ocr_used=False  # Would need to be set externally if OCR was used
         )
 
-    def _extract_entities(self, text: str) -> Entities:
+    def _extract_entities(self, subject: str | bytes) -> Entities:
         """Extract buyer, seller, and target entities."""
         # This is a simplified version - in practice, you'd use more sophisticated NER
         
-        # Look for common entity patterns
-        company_patterns = [
-            r'([A-Z][a-zA-Z\s&]+(?:Inc|LLC|Ltd|Corp|Corporation|Limited|Company)\.?)',
-            r'([A-Z][a-zA-Z\s&]+(?:Holdings|Group|Partners|Capital|Ventures))',
-        ]
-        
-        entities = []
-        for pattern in company_patterns:
-            matches = re.findall(pattern, text)
-            entities.extend([match.strip() for match in matches])
-        
-        # Remove duplicates and filter
-        unique_entities = list(set([e for e in entities if len(e) > 5]))
+        # Look for common entity patterns; only the first three distinct names are used
+        seen: Dict[str, None] = {}
+        for entity_re in self._entity_res:
+            for match in entity_re.finditer(subject):
+                name = _text(match.group(1)).strip()
+                if len(name) > 5:
+                    seen[name] = None
+                    if len(seen) >= 3:
+                        break
+            if len(seen) >= 3:
+                break
+        unique_entities = list(seen)
         
         buyer = EntityInfo()
         seller = EntityInfo()
@@ -232,41 +435,32 @@ class DealCompletenessAnalyzer:
         
         return Entities(buyer=buyer, seller=seller, target=target)
 
-    def _analyze_deal_info(self, text: str) -> DealInfo:
+    def _analyze_deal_info(self, subject: str | bytes, hits: Dict[str, int]) -> DealInfo:
         """Analyze deal structure and key information using comprehensive keyword matching."""
-        text_lower = text.lower()
-        
         # Enhanced structure detection using bucket keywords
         structure = "unknown"
         deal_keywords = self.bucket_keywords['deal_identity']
         
-        if any(term in text_lower for term in ["asset purchase", "asset sale"]):
-            structure = "asset_purchase"
-        elif any(term in text_lower for term in ["share purchase", "stock purchase", "equity purchase"]):
-            structure = "share_purchase"
-        elif "merger" in text_lower:
-            structure = "merger"
-        elif "scheme of arrangement" in text_lower:
-            structure = "scheme"
-        elif "tender offer" in text_lower:
-            structure = "tender_offer"
+        structure = next(
+            (label for terms, label in _STRUCTURE_RULES if any(term in hits for term in terms)), structure
+        )
         
         # Extract dates using enhanced patterns
-        signing_date = self._extract_first_date(text)
+        signing_date = self._extract_first_date(subject)
         closing_date = ""
-        if any(term in text_lower for term in ["closing date", "completion date"]):
-            closing_date = self._extract_date_near_term(text, ["closing", "completion"])
+        if any(term in hits for term in ["closing date", "completion date"]):
+            closing_date = self._extract_date_near_term(subject)
         
         # Enhanced governing law detection
         governing_law = ""
-        if any(term in text_lower for term in ["governed by", "governing law", "jurisdiction", "venue"]):
-            gov_match = re.search(r'governed?\s+by\s+(?:the\s+)?laws?\s+of\s+([A-Za-z\s]+)', text, re.IGNORECASE)
+        if any(term in hits for term in ["governed by", "governing law", "jurisdiction", "venue"]):
+            gov_match = self._governing_law_re.search(subject)
             if gov_match:
-                governing_law = gov_match.group(1).strip()
+                governing_law = _text(gov_match.group(1)).strip()
         
         # Enhanced defined terms and schedules detection
-        defined_terms_present = any(re.search(pattern, text, re.IGNORECASE) for pattern in self.defined_term_patterns)
-        schedule_refs_present = any(re.search(pattern, text, re.IGNORECASE) for pattern in self.schedule_patterns)
+        defined_terms_present = bool(self._defined_term_re.search(subject))
+        schedule_refs_present = bool(self._schedule_re.search(subject))
         
         return DealInfo(
             structure=structure,
@@ -277,43 +471,42 @@ class DealCompletenessAnalyzer:
             schedule_or_exhibit_refs_present=schedule_refs_present
         )
 
-    def _analyze_price_and_payment(self, text: str) -> PriceAndPayment:
+    def _analyze_price_and_payment(self, text: str, text_lower: str, hits: Dict[str, int],
+                                   subject: str | bytes) -> PriceAndPayment:
         """Analyze pricing and payment terms using comprehensive keyword matching."""
         
         # Use bucket keyword matching for more comprehensive detection
-        purchase_price_present = self._check_bucket_keywords(text, 'price_payment', min_hits=2)
-        currency_present = any(re.search(pattern, text, re.IGNORECASE) for pattern in self.currency_patterns)
-        
-        text_lower = text.lower()
+        purchase_price_present = self._check_bucket_keywords(text, 'price_payment', min_hits=2, hits=hits)
+        currency_present = bool(self._currency_re.search(subject))
         
         # Enhanced valuation terms detection
-        enterprise_value_present = "enterprise value" in text_lower
-        equity_value_present = "equity value" in text_lower
-        net_debt_present = any(term in text_lower for term in ["net debt", "cash-free debt-free"])
-        working_capital_present = "working capital" in text_lower
+        enterprise_value_present = "enterprise value" in hits
+        equity_value_present = "equity value" in hits
+        net_debt_present = any(term in hits for term in ["net debt", "cash-free debt-free"])
+        working_capital_present = "working capital" in hits
         
         # Enhanced adjustment mechanisms
-        adjustment_mechanism_present = any(term in text_lower for term in [
-            "adjustment", "true-up", "closing statement", "closing adjustment"
-        ])
+        adjustment_mechanism_present = any(term in hits for term in [
+            "adjustment", "true-up", "closing statement"
+        ]) or "closing adjustment" in hits
         
-        earnout_present = any(term in text_lower for term in ["earn-out", "earnout", "milestone payment"])
-        escrow_present = any(term in text_lower for term in ["escrow", "holdback", "retention amount"])
+        earnout_present = any(term in hits for term in ["earn-out", "milestone payment"]) or "earnout" in hits
+        escrow_present = any(term in hits for term in ["escrow", "holdback", "retention amount"])
         
         # Enhanced payment form detection
         payment_form = "unknown"
-        if any(term in text_lower for term in ["cash consideration", "stock consideration"]):
-            if "cash consideration" in text_lower and "stock consideration" in text_lower:
+        if any(term in hits for term in ["cash consideration", "stock consideration"]):
+            if "cash consideration" in hits and "stock consideration" in hits:
                 payment_form = "mixed"
-            elif "cash consideration" in text_lower:
+            elif "cash consideration" in hits:
                 payment_form = "cash"
-            elif "stock consideration" in text_lower:
+            elif "stock consideration" in hits:
                 payment_form = "stock"
-        elif "exchange ratio" in text_lower:
+        elif "exchange ratio" in hits:
             payment_form = "stock"
         
         # Extract evidence snippets
-        evidence_snippets = self._extract_bucket_evidence(text, 'price_payment')
+        evidence_snippets = self._extract_bucket_evidence(text, 'price_payment', hits=hits)
         
         return PriceAndPayment(
             purchase_price_present=purchase_price_present,
@@ -329,38 +522,36 @@ class DealCompletenessAnalyzer:
             evidence_snippets=evidence_snippets
         )
 
-    def _analyze_reps_warranties(self, text: str) -> RepsAndWarranties:
+    def _analyze_reps_warranties(self, text: str, text_lower: str, hits: Dict[str, int]) -> RepsAndWarranties:
         """Analyze representations and warranties section using comprehensive keyword matching."""
         
         # Use comprehensive keyword matching
-        section_present = self._check_bucket_keywords(text, 'reps_warranties', min_hits=3)
-        
-        text_lower = text.lower()
+        section_present = self._check_bucket_keywords(text, 'reps_warranties', min_hits=3, hits=hits)
         
         # Enhanced detection using bucket keywords
-        disclosure_schedules_present = any(term in text_lower for term in ["disclosure schedule", "disclosure schedules"])
-        mae_mac_present = any(term in text_lower for term in ["material adverse effect", "MAE", "MAC"])
-        knowledge_qualifiers_present = any(term in text_lower for term in ["knowledge qualifier", "to the knowledge of"])
+        disclosure_schedules_present = any(term in hits for term in ["disclosure schedule", "disclosure schedules"])
+        mae_mac_present = "material adverse effect" in hits or any(term in text_lower for term in ["MAE", "MAC"])
+        knowledge_qualifiers_present = any(term in hits for term in ["knowledge qualifier", "to the knowledge of"])
         
         # Comprehensive representation topics using bucket keywords
         rep_topics = RepTopics(
-            authority_organisation=any(term in text_lower for term in ["authority", "organisation", "capitalization"]),
-            capitalisation="capitalisation" in text_lower or "capitalization" in text_lower,
-            financial_statements="financial statements" in text_lower,
-            undisclosed_liabilities="undisclosed liabilit" in text_lower,
-            compliance_with_laws="compliance with laws" in text_lower,
-            tax="tax matters" in text_lower or ("tax" in text_lower and "return" in text_lower),
-            employment_benefits=any(term in text_lower for term in ["employment", "benefits"]),
-            ip=any(term in text_lower for term in ["intellectual property", "IP", "infringement"]),
-            material_contracts="material contracts" in text_lower,
-            litigation_investigations=any(term in text_lower for term in ["litigation", "investigation"]),
-            environmental="environmental" in text_lower,
-            anti_corruption_sanctions_aml=any(term in text_lower for term in ["anti-corruption", "sanctions", "AML"]),
-            data_protection_privacy=any(term in text_lower for term in ["data protection", "privacy"])
+            authority_organisation=any(term in hits for term in ["authority", "organisation", "capitalization"]),
+            capitalisation="capitalisation" in hits or "capitalization" in hits,
+            financial_statements="financial statements" in hits,
+            undisclosed_liabilities="undisclosed liabilit" in hits,
+            compliance_with_laws="compliance with laws" in hits,
+            tax="tax matters" in hits or ("tax" in hits and "return" in hits),
+            employment_benefits=any(term in hits for term in ["employment", "benefits"]),
+            ip=any(term in hits for term in ["intellectual property", "infringement"]) or "IP" in text_lower,
+            material_contracts="material contracts" in hits,
+            litigation_investigations=any(term in hits for term in ["litigation", "investigation"]),
+            environmental="environmental" in hits,
+            anti_corruption_sanctions_aml=any(term in hits for term in ["anti-corruption", "sanctions"]) or "AML" in text_lower,
+            data_protection_privacy=any(term in hits for term in ["data protection", "privacy"])
         )
         
         # Extract evidence snippets
-        evidence_snippets = self._extract_bucket_evidence(text, 'reps_warranties')
+        evidence_snippets = self._extract_bucket_evidence(text, 'reps_warranties', hits=hits)
         
         return RepsAndWarranties(
             section_present=section_present,
@@ -371,23 +562,21 @@ class DealCompletenessAnalyzer:
             evidence_snippets=evidence_snippets
         )
 
-    def _analyze_closing_conditions(self, text: str) -> ClosingConditions:
+    def _analyze_closing_conditions(self, text: str, text_lower: str, hits: Dict[str, int]) -> ClosingConditions:
         """Analyze closing conditions using comprehensive keyword matching."""
         
-        section_present = self._check_bucket_keywords(text, 'closing_conditions', min_hits=2)
-        
-        text_lower = text.lower()
+        section_present = self._check_bucket_keywords(text, 'closing_conditions', min_hits=2, hits=hits)
         
         # Enhanced detection using bucket keywords
-        regulatory_approvals_present = any(term in text_lower for term in ["regulatory approval", "clearance"])
-        third_party_consents_present = "third party consent" in text_lower or "third-party consent" in text_lower
-        shareholder_board_approval_present = any(term in text_lower for term in ["board approval", "shareholder approval"])
-        no_injunction_present = "no injunction" in text_lower
-        bring_down_present = "bring-down" in text_lower or "bring down" in text_lower
-        deliverables_present = any(term in text_lower for term in ["deliverables", "closing deliverables"])
+        regulatory_approvals_present = any(term in hits for term in ["regulatory approval", "clearance"])
+        third_party_consents_present = "third party consent" in hits or "third-party consent" in hits
+        shareholder_board_approval_present = any(term in hits for term in ["board approval", "shareholder approval"])
+        no_injunction_present = "no injunction" in hits
+        bring_down_present = "bring-down" in hits or "bring down" in hits
+        deliverables_present = any(term in hits for term in ["deliverables", "closing deliverables"])
         
         # Extract evidence snippets
-        evidence_snippets = self._extract_bucket_evidence(text, 'closing_conditions')
+        evidence_snippets = self._extract_bucket_evidence(text, 'closing_conditions', hits=hits)
         
         return ClosingConditions(
             section_present=section_present,
@@ -400,26 +589,24 @@ class DealCompletenessAnalyzer:
             evidence_snippets=evidence_snippets
         )
 
-    def _analyze_indemnities(self, text: str) -> IndemnitiesAndLimits:
+    def _analyze_indemnities(self, text: str, text_lower: str, hits: Dict[str, int]) -> IndemnitiesAndLimits:
         """Analyze indemnification provisions using comprehensive keyword matching."""
         
         # Use comprehensive bucket keyword matching
-        indemnity_present = self._check_bucket_keywords(text, 'indemnities_limits', min_hits=2)
-        
-        text_lower = text.lower()
+        indemnity_present = self._check_bucket_keywords(text, 'indemnities_limits', min_hits=2, hits=hits)
         
         # Enhanced detection
-        survival_present = "survival period" in text_lower or "survival" in text_lower
-        basket_present = any(term in text_lower for term in ["basket", "deductible", "tipping basket"])
-        cap_present = any(term in text_lower for term in ["cap", "limitation of liability", "maximum"])
-        escrow_claims_process_present = "escrow claims" in text_lower
-        fraud_carveout_present = any(term in text_lower for term in ["fraud carve-out", "willful misconduct"])
-        rwi_present = any(term in text_lower for term in [
-            "representation and warranty insurance", "RWI", "reps and warranties insurance"
-        ])
+        survival_present = "survival period" in hits or "survival" in hits
+        basket_present = any(term in hits for term in ["basket", "deductible", "tipping basket"])
+        cap_present = any(term in hits for term in ["cap", "limitation of liability"]) or "maximum" in hits
+        escrow_claims_process_present = "escrow claims" in hits
+        fraud_carveout_present = any(term in hits for term in ["fraud carve-out", "willful misconduct"])
+        rwi_present = any(term in hits for term in [
+            "representation and warranty insurance", "reps and warranties insurance"
+        ]) or "RWI" in text_lower
         
         # Extract evidence snippets
-        evidence_snippets = self._extract_bucket_evidence(text, 'indemnities_limits')
+        evidence_snippets = self._extract_bucket_evidence(text, 'indemnities_limits', hits=hits)
         
         return IndemnitiesAndLimits(
             indemnity_present=indemnity_present,
@@ -432,15 +619,13 @@ class DealCompletenessAnalyzer:
             evidence_snippets=evidence_snippets
         )
 
-    def _analyze_financials(self, text: str) -> Financials:
+    def _analyze_financials(self, text: str, text_lower: str, hits: Dict[str, int]) -> Financials:
         """Analyze financial statement information using comprehensive keyword matching."""
         
-        financial_statements_present = self._check_bucket_keywords(text, 'financials', min_hits=2)
-        
-        text_lower = text.lower()
+        financial_statements_present = self._check_bucket_keywords(text, 'financials', min_hits=2, hits=hits)
         
         # Enhanced financial analysis detection
-        audited_unaudited_present = "audited" in text_lower or "unaudited" in text_lower
+        audited_unaudited_present = "audited" in hits or "unaudited" in hits
         standard_present = "unknown"
         if "IFRS" in text_lower:
             standard_present = "ifrs"
@@ -448,17 +633,17 @@ class DealCompletenessAnalyzer:
             standard_present = "us_gaap"
         elif "SSFRS" in text_lower:
             standard_present = "ssfrs"
-        elif any(term in text_lower for term in ["accounting standard", "accounting principle"]):
+        elif any(term in hits for term in ["accounting standard", "accounting principle"]):
             standard_present = "other"
         
-        period_covered_present = any(term in text_lower for term in ["period", "year ended", "quarter ended"])
+        period_covered_present = any(term in hits for term in ["period", "year ended", "quarter ended"])
         ebitda_present = any(term in text_lower for term in ["EBITDA", "adjusted EBITDA"])
-        revenue_recognition_present = "revenue recognition" in text_lower
-        forecast_budget_present = any(term in text_lower for term in ["forecast", "projections", "budget"])
-        qoe_present = any(term in text_lower for term in ["quality of earnings", "QoE"])
+        revenue_recognition_present = "revenue recognition" in hits
+        forecast_budget_present = any(term in hits for term in ["forecast", "projections", "budget"])
+        qoe_present = "quality of earnings" in hits or "QoE" in text_lower
         
         # Extract evidence snippets
-        evidence_snippets = self._extract_bucket_evidence(text, 'financials')
+        evidence_snippets = self._extract_bucket_evidence(text, 'financials', hits=hits)
         
         return Financials(
             financial_statements_present=financial_statements_present,
@@ -472,24 +657,22 @@ class DealCompletenessAnalyzer:
             evidence_snippets=evidence_snippets
         )
 
-    def _analyze_litigation(self, text: str) -> LitigationAndAllegations:
+    def _analyze_litigation(self, text: str, text_lower: str, hits: Dict[str, int]) -> LitigationAndAllegations:
         """Analyze litigation and legal proceedings using comprehensive keyword matching."""
         
         # Use comprehensive bucket keyword matching
-        litigation_present = self._check_bucket_keywords(text, 'litigation_claims', min_hits=2)
-        
-        text_lower = text.lower()
+        litigation_present = self._check_bucket_keywords(text, 'litigation_claims', min_hits=2, hits=hits)
         
         # Enhanced detection using comprehensive keywords
-        allegations_accusations_present = any(term in text_lower for term in ["allegation", "accusations", "complaint"])
-        regulatory_investigation_present = any(term in text_lower for term in ["investigation", "inquiry", "subpoena"])
-        demand_letters_present = any(term in text_lower for term in ["demand letter", "cease and desist"])
-        settlement_consent_order_present = any(term in text_lower for term in ["settlement", "consent order", "injunction"])
-        contingent_liability_reserves_present = any(term in text_lower for term in ["contingent liability", "provision", "reserve"])
-        whistleblower_internal_investigation_present = any(term in text_lower for term in ["whistleblower", "internal investigation"])
+        allegations_accusations_present = any(term in hits for term in ["allegation", "accusations", "complaint"])
+        regulatory_investigation_present = any(term in hits for term in ["investigation", "inquiry", "subpoena"])
+        demand_letters_present = any(term in hits for term in ["demand letter", "cease and desist"])
+        settlement_consent_order_present = any(term in hits for term in ["settlement", "consent order", "injunction"])
+        contingent_liability_reserves_present = any(term in hits for term in ["contingent liability", "provision", "reserve"])
+        whistleblower_internal_investigation_present = any(term in hits for term in ["whistleblower", "internal investigation"])
         
         # Extract evidence snippets
-        evidence_snippets = self._extract_bucket_evidence(text, 'litigation_claims')
+        evidence_snippets = self._extract_bucket_evidence(text, 'litigation_claims', hits=hits)
         
         return LitigationAndAllegations(
             litigation_present=litigation_present,
@@ -502,16 +685,22 @@ class DealCompletenessAnalyzer:
             evidence_snippets=evidence_snippets
         )
 
-    def _analyze_evidence_strength(self, text: str) -> EvidenceStrength:
+    def _analyze_evidence_strength(self, subject: str | bytes) -> EvidenceStrength:
         """Analyze the strength of evidence in the document."""
         
-        numbers_present = bool(re.search(r'\d+', text))
-        dates_present = any(re.search(pattern, text) for pattern in self.date_patterns)
-        percentages_present = any(re.search(pattern, text) for pattern in self.percentage_patterns)
-        defined_term_pattern_present = any(re.search(pattern, text, re.IGNORECASE) 
-                                         for pattern in self.defined_term_patterns)
-        schedule_exhibit_pattern_present = any(re.search(pattern, text, re.IGNORECASE) 
-                                             for pattern in self.schedule_patterns)
+        numbers_present = bool(self._number_re.search(subject))
+        if _re is not re:
+            found = self._evidence_signals(subject)
+            dates_present = "date" in found
+            percentages_present = "pct" in found
+            defined_term_pattern_present = "defined" in found
+            schedule_exhibit_pattern_present = "schedule" in found
+        else:
+            # stdlib re tries the alternation branch by branch, so separate searches are faster
+            dates_present = bool(self._date_re.search(subject))
+            percentages_present = bool(self._percentage_re.search(subject))
+            defined_term_pattern_present = bool(self._defined_term_re.search(subject))
+            schedule_exhibit_pattern_present = bool(self._schedule_re.search(subject))
         
         return EvidenceStrength(
             numbers_present=numbers_present,
@@ -521,79 +710,147 @@ class DealCompletenessAnalyzer:
             schedule_exhibit_pattern_present=schedule_exhibit_pattern_present
         )
 
-    def _extract_first_date(self, text: str) -> str:
+    def _evidence_signals(self, subject: str | bytes) -> set:
+        """Names of the _EVIDENCE_RE groups that match anywhere in the text, in one pass."""
+        found = set()
+        search = self._evidence_re.search
+        pos = 0
+        # Resume just after each match start rather than its end, so a signal overlapping
+        # another one (e.g. the date in "Exhibit 5 jan 2024") is still seen
+        while len(found) < 4:
+            match = search(subject, pos)
+            if match is None:
+                break
+            found.add(_text(match.lastgroup))
+            pos = match.start() + 1
+        return found
+
+    def _extract_first_date(self, subject: str | bytes) -> str:
         """Extract the first date found in the text."""
-        for pattern in self.date_patterns:
-            match = re.search(pattern, text)
+        for date_re in self._date_res:
+            match = date_re.search(subject)
             if match:
-                return match.group(0)
+                return _text(match.group(0))
         return ""
 
-    def _extract_date_near_term(self, text: str, terms: List[str]) -> str:
-        """Extract a date near specific terms."""
-        for term in terms:
-            # Look for dates within 100 characters of the term
-            pattern = f'{term}.{0,100}?' + '|'.join(self.date_patterns)
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+    def _extract_date_near_term(self, subject: str | bytes) -> str:
+        """Extract a date near the closing/completion terms."""
+        for closing_date_re in self._closing_date_res:
+            match = closing_date_re.search(subject)
             if match:
                 # Extract just the date part
-                for date_pattern in self.date_patterns:
-                    date_match = re.search(date_pattern, match.group(0))
+                for date_re in self._date_res:
+                    date_match = date_re.search(match.group(0))
                     if date_match:
-                        return date_match.group(0)
+                        return _text(date_match.group(0))
         return ""
 
-    def _check_bucket_keywords(self, text: str, bucket_name: str, min_hits: int = 1) -> bool:
+    def _keyword_hits(self, text_lower: str) -> Dict[str, int]:
+        """
+        Map each scan term found in the lowercased text to its first offset.
+        Analyzers test lowercase keywords and probe terms with `term in hits`.
+        """
+        hits: Dict[str, int] = {}
+        if self._keyword_automaton is not None:
+            # Matches arrive in end-offset order, so the first one per keyword is its earliest
+            for end, kw in self._keyword_automaton.iter(text_lower):
+                if kw not in hits:
+                    hits[kw] = end - len(kw) + 1
+            return hits
+        
+        for kw in _SCAN_TERMS:
+            start = text_lower.find(kw)
+            if start != -1:
+                hits[kw] = start
+        return hits
+
+    def _keyword_hits_batch(self, texts_lower: List[str]) -> List[Dict[str, int]]:
+        """`_keyword_hits` for many documents, scanning them as one NUL-separated buffer."""
+        if self._keyword_automaton is None or len(texts_lower) <= 1:
+            return [self._keyword_hits(t) for t in texts_lower]
+        
+        # No keyword contains NUL, so matches never straddle two documents
+        buf = "\0".join(texts_lower)
+        hits_per_doc: List[Dict[str, int]] = [{} for _ in texts_lower]
+        doc_starts = [0]
+        for t in texts_lower[:-1]:
+            doc_starts.append(doc_starts[-1] + len(t) + 1)
+        
+        doc = 0
+        for end, kw in self._keyword_automaton.iter(buf):
+            # Matches arrive in end-offset order, so the owning document only moves forward
+            while doc + 1 < len(doc_starts) and end >= doc_starts[doc + 1]:
+                doc += 1
+            hits = hits_per_doc[doc]
+            if kw not in hits:
+                hits[kw] = end - len(kw) + 1 - doc_starts[doc]
+        return hits_per_doc
+
+    def _bucket_has_hits(self, bucket_name: str, hits: Dict[str, int]) -> bool:
+        return any(keyword in hits for keyword in _BUCKET_KEYWORDS_LOWER[bucket_name])
+
+    def _check_bucket_keywords(self, text: str, bucket_name: str, min_hits: int = 1,
+                               hits: Optional[Dict[str, int]] = None) -> bool:
         """Check if text contains minimum number of keywords from a bucket."""
         if bucket_name not in self.bucket_keywords:
             return False
         
-        text_lower = text.lower()
-        keywords = self.bucket_keywords[bucket_name]
-        hits = sum(1 for keyword in keywords if keyword.lower() in text_lower)
+        if hits is None:
+            hits = self._keyword_hits(text.lower())
+        found = sum(1 for keyword in _BUCKET_KEYWORDS_LOWER[bucket_name] if keyword in hits)
         
-        return hits >= min_hits
+        return found >= min_hits
 
-    def _extract_bucket_evidence(self, text: str, bucket_name: str, max_snippets: int = 3) -> List[str]:
+    def _extract_bucket_evidence(self, text: str, bucket_name: str, max_snippets: int = 3,
+                                 hits: Optional[Dict[str, int]] = None) -> List[str]:
         """Extract evidence snippets for a bucket."""
         if bucket_name not in self.bucket_keywords:
             return []
         
-        text_lower = text.lower()
-        keywords = self.bucket_keywords[bucket_name]
+        if hits is None:
+            hits = self._keyword_hits(text.lower())
         snippets = []
         
-        for keyword in keywords:
+        # Offsets come straight from the hit table; no per-keyword search of the text
+        found = []
+        for i, keyword in enumerate(_BUCKET_KEYWORDS_LOWER[bucket_name]):
+            start = hits.get(keyword)
+            if start is not None:
+                found.append((i, start, start + len(keyword)))
+        
+        # Longest match wins: a keyword first seen inside a longer keyword's first occurrence
+        # (e.g. "disclosure schedule" within "disclosure schedules") adds no new evidence
+        spans = []
+        for i, start, end in sorted(found, key=lambda f: f[1] - f[2]):
+            if not any(s <= start and end <= e for _, s, e in spans):
+                spans.append((i, start, end))
+        spans.sort()
+        
+        for _, start, end in spans:
             if len(snippets) >= max_snippets:
                 break
-            if keyword.lower() in text_lower:
-                # Find the keyword in context
-                start = text_lower.find(keyword.lower())
-                if start != -1:
-                    # Extract surrounding context (50 chars before and after)
-                    context_start = max(0, start - 50)
-                    context_end = min(len(text), start + len(keyword) + 50)
-                    snippet = text[context_start:context_end].strip()
-                    if snippet and snippet not in snippets:
-                        snippets.append(snippet)
+            # Extract surrounding context (50 chars before and after)
+            context_start = max(0, start - 50)
+            context_end = min(len(text), end + 50)
+            snippet = text[context_start:context_end].strip()
+            if snippet and snippet not in snippets:
+                snippets.append(snippet)
         
         return snippets
 
-    def _analyze_covenants(self, text: str) -> Covenants:
+    def _analyze_covenants(self, text: str, text_lower: str, hits: Dict[str, int]) -> Covenants:
         """Analyze covenants using comprehensive keyword matching."""
         
-        section_present = self._check_bucket_keywords(text, 'covenants', min_hits=1)
+        section_present = self._check_bucket_keywords(text, 'covenants', min_hits=1, hits=hits)
         
-        text_lower = text.lower()
-        
-        ordinary_course_present = "ordinary course" in text_lower
-        negative_covenants_present = "negative covenant" in text_lower
-        access_to_info_due_diligence_present = any(term in text_lower for term in ["access to information", "due diligence"])
-        employee_matters_present = any(term in text_lower for term in ["employee matters", "retention"])
-        confidentiality_noncompete_present = any(term in text_lower for term in ["non-compete", "non-solicit", "confidentiality"])
-        tsa_transition_present = any(term in text_lower for term in ["transition services", "TSA"])
+        ordinary_course_present = "ordinary course" in hits
+        negative_covenants_present = "negative covenant" in hits
+        access_to_info_due_diligence_present = any(term in hits for term in ["access to information", "due diligence"])
+        employee_matters_present = any(term in hits for term in ["employee matters", "retention"])
+        confidentiality_noncompete_present = any(term in hits for term in ["non-compete", "non-solicit", "confidentiality"])
+        tsa_transition_present = "transition services" in hits or "TSA" in text_lower
         
-        evidence_snippets = self._extract_bucket_evidence(text, 'covenants')
+        evidence_snippets = self._extract_bucket_evidence(text, 'covenants', hits=hits)
         
         return Covenants(
             section_present=section_present,
@@ -606,19 +863,17 @@ class DealCompletenessAnalyzer:
             evidence_snippets=evidence_snippets
         )
 
-    def _analyze_capital_debt(self, text: str) -> CapitalAndDebt:
+    def _analyze_capital_debt(self, text: str, text_lower: str, hits: Dict[str, int]) -> CapitalAndDebt:
         """Analyze capital structure and debt using comprehensive keyword matching."""
         
-        text_lower = text.lower()
+        cap_table_present = any(term in hits for term in ["cap table", "capitalization table"])
+        securities_present = any(term in hits for term in ["options", "warrants", "convertibles", "preference shares"]) or "SAFE" in text_lower
+        debt_facility_present = any(term in hits for term in ["credit facility", "loan agreement", "debt"])
+        liens_security_interest_present = any(term in hits for term in ["lien", "charge", "pledge", "security interest", "mortgage"])
+        defaults_waivers_present = any(term in hits for term in ["default", "covenant breach", "waiver"])
+        payoff_release_present = any(term in hits for term in ["payoff letter", "release of liens"])
         
-        cap_table_present = any(term in text_lower for term in ["cap table", "capitalization table"])
-        securities_present = any(term in text_lower for term in ["options", "warrants", "convertibles", "SAFE", "preference shares"])
-        debt_facility_present = any(term in text_lower for term in ["credit facility", "loan agreement", "debt"])
-        liens_security_interest_present = any(term in text_lower for term in ["lien", "charge", "pledge", "security interest", "mortgage"])
-        defaults_waivers_present = any(term in text_lower for term in ["default", "covenant breach", "waiver"])
-        payoff_release_present = any(term in text_lower for term in ["payoff letter", "release of liens"])
-        
-        evidence_snippets = self._extract_bucket_evidence(text, 'capital_debt')
+        evidence_snippets = self._extract_bucket_evidence(text, 'capital_debt', hits=hits)
         
         return CapitalAndDebt(
             cap_table_present=cap_table_present,
@@ -630,19 +885,17 @@ class DealCompletenessAnalyzer:
             evidence_snippets=evidence_snippets
         )
 
-    def _analyze_tax(self, text: str) -> Tax:
+    def _analyze_tax(self, text: str, text_lower: str, hits: Dict[str, int]) -> Tax:
         """Analyze tax matters using comprehensive keyword matching."""
         
-        text_lower = text.lower()
-        
-        tax_returns_present = "tax returns" in text_lower
-        tax_audits_disputes_present = any(term in text_lower for term in ["tax audit", "assessment"])
-        withholding_present = "withholding tax" in text_lower
+        tax_returns_present = "tax returns" in hits
+        tax_audits_disputes_present = any(term in hits for term in ["tax audit", "assessment"])
+        withholding_present = "withholding tax" in hits
         vat_gst_present = any(term in text_lower for term in ["VAT", "GST"])
-        transfer_pricing_present = "transfer pricing" in text_lower
-        tax_indemnity_covenant_present = any(term in text_lower for term in ["tax indemnity", "tax covenant"])
+        transfer_pricing_present = "transfer pricing" in hits
+        tax_indemnity_covenant_present = any(term in hits for term in ["tax indemnity", "tax covenant"])
         
-        evidence_snippets = self._extract_bucket_evidence(text, 'tax')
+        evidence_snippets = self._extract_bucket_evidence(text, 'tax', hits=hits)
         
         return Tax(
             tax_returns_present=tax_returns_present,
@@ -654,23 +907,21 @@ class DealCompletenessAnalyzer:
             evidence_snippets=evidence_snippets
         )
 
-    def _analyze_compliance(self, text: str) -> Compliance:
+    def _analyze_compliance(self, text: str, text_lower: str, hits: Dict[str, int]) -> Compliance:
         """Analyze compliance matters using comprehensive keyword matching."""
         
         # Use comprehensive bucket keyword matching
-        compliance_present = self._check_bucket_keywords(text, 'compliance', min_hits=1)
-        
-        text_lower = text.lower()
+        compliance_present = self._check_bucket_keywords(text, 'compliance', min_hits=1, hits=hits)
         
-        anti_bribery_present = any(term in text_lower for term in ["anti-bribery", "anti-corruption", "FCPA", "UK bribery act"])
-        aml_kyc_sanctions_present = any(term in text_lower for term in ["AML", "KYC", "sanctions", "OFAC"])
-        competition_antitrust_present = any(term in text_lower for term in ["antitrust", "competition law"])
-        privacy_data_protection_present = any(term in text_lower for term in ["PDPA", "GDPR", "data protection", "privacy"])
-        cybersecurity_breach_present = any(term in text_lower for term in ["cybersecurity", "data breach"])
-        export_controls_present = "export controls" in text_lower
-        environment_hs_present = any(term in text_lower for term in ["health and safety", "environmental"])
+        anti_bribery_present = any(term in hits for term in ["anti-bribery", "anti-corruption"]) or any(term in text_lower for term in ["FCPA", "UK bribery act"])
+        aml_kyc_sanctions_present = "sanctions" in hits or any(term in text_lower for term in ["AML", "KYC", "OFAC"])
+        competition_antitrust_present = any(term in hits for term in ["antitrust", "competition law"])
+        privacy_data_protection_present = any(term in hits for term in ["data protection", "privacy"]) or any(term in text_lower for term in ["PDPA", "GDPR"])
+        cybersecurity_breach_present = any(term in hits for term in ["cybersecurity", "data breach"])
+        export_controls_present = "export controls" in hits
+        environment_hs_present = any(term in hits for term in ["health and safety", "environmental"])
         
-        evidence_snippets = self._extract_bucket_evidence(text, 'compliance')
+        evidence_snippets = self._extract_bucket_evidence(text, 'compliance', hits=hits)
         
         return Compliance(
             anti_bribery_present=anti_bribery_present,
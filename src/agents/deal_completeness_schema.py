@@ -1,8 +1,24 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import List, Literal, Dict, Any, Tuple
 from pydantic import BaseModel, Field
 
+# Report names of the core buckets, in the bit order of DealCompletenessAnalysis._compute_bucket_mask()
+_BUCKET_NAMES = (
+    "deal_identity", "price_payment", "reps_warranties",
+    "closing_conditions", "indemnities_limits",
+    "financials", "litigation_claims"
+)
+
+# Bit positions of the core buckets in DealCompletenessAnalysis._compute_bucket_mask()
+_BUCKET_C = 1 << 2
+_BUCKET_E = 1 << 3
+_BUCKET_G = 1 << 4
+
+# Document types that may be flagged as a teaser or summary
+_TEASER_TYPES = frozenset({"teaser", "loi", "term_sheet", "other"})
+
 class DocumentMetadata(BaseModel):
     doc_type_guess: Literal["spa", "apa", "msa", "loi", "term_sheet", "nda", "teaser", "financials", "other"]
     language: str = "en"
@@ -44,7 +60,8 @@ class PriceAndPayment(BaseModel):
     payment_form: Literal["cash", "stock", "mixed", "unknown"] = "unknown"
     evidence_snippets: List[str] = Field(default_factory=list)
 
-class RepTopics(BaseModel):
+@dataclass(slots=True)
+class RepTopics:
     authority_organisation: bool = False
     capitalisation: bool = False
     financial_statements: bool = False
@@ -59,15 +76,17 @@ class RepTopics(BaseModel):
     anti_corruption_sanctions_aml: bool = False
     data_protection_privacy: bool = False
 
-class RepsAndWarranties(BaseModel):
+@dataclass(slots=True)
+class RepsAndWarranties:
     section_present: bool = False
     disclosure_schedules_present: bool = False
     mae_mac_present: bool = False
     knowledge_qualifiers_present: bool = False
-    rep_topics_hit: RepTopics = Field(default_factory=RepTopics)
-    evidence_snippets: List[str] = Field(default_factory=list)
+    rep_topics_hit: RepTopics = field(default_factory=RepTopics)
+    evidence_snippets: List[str] = field(default_factory=list)
 
-class Covenants(BaseModel):
+@dataclass(slots=True)
+class Covenants:
     section_present: bool = False
     ordinary_course_present: bool = False
     negative_covenants_present: bool = False
@@ -75,9 +94,10 @@ class Covenants(BaseModel):
     employee_matters_present: bool = False
     confidentiality_noncompete_present: bool = False
     tsa_transition_present: bool = False
-    evidence_snippets: List[str] = Field(default_factory=list)
+    evidence_snippets: List[str] = field(default_factory=list)
 
-class ClosingConditions(BaseModel):
+@dataclass(slots=True)
+class ClosingConditions:
     section_present: bool = False
     regulatory_approvals_present: bool = False
     third_party_consents_present: bool = False
@@ -85,17 +105,19 @@ class ClosingConditions(BaseModel):
     no_injunction_present: bool = False
     bring_down_present: bool = False
     deliverables_present: bool = False
-    evidence_snippets: List[str] = Field(default_factory=list)
+    evidence_snippets: List[str] = field(default_factory=list)
 
-class TerminationAndRemedies(BaseModel):
+@dataclass(slots=True)
+class TerminationAndRemedies:
     termination_rights_present: bool = False
     outside_date_present: bool = False
     break_fee_present: bool = False
     specific_performance_present: bool = False
     remedies_present: bool = False
-    evidence_snippets: List[str] = Field(default_factory=list)
+    evidence_snippets: List[str] = field(default_factory=list)
 
-class IndemnitiesAndLimits(BaseModel):
+@dataclass(slots=True)
+class IndemnitiesAndLimits:
     indemnity_present: bool = False
     survival_present: bool = False
     basket_present: bool = False
@@ -103,7 +125,7 @@ class IndemnitiesAndLimits(BaseModel):
     escrow_claims_process_present: bool = False
     fraud_carveout_present: bool = False
     rwi_present: bool = False
-    evidence_snippets: List[str] = Field(default_factory=list)
+    evidence_snippets: List[str] = field(default_factory=list)
 
 class Financials(BaseModel):
     financial_statements_present: bool = False
@@ -116,25 +138,28 @@ class Financials(BaseModel):
     qoe_present: bool = False
     evidence_snippets: List[str] = Field(default_factory=list)
 
-class CapitalAndDebt(BaseModel):
+@dataclass(slots=True)
+class CapitalAndDebt:
     cap_table_present: bool = False
     securities_present: bool = False
     debt_facility_present: bool = False
     liens_security_interest_present: bool = False
     defaults_waivers_present: bool = False
     payoff_release_present: bool = False
-    evidence_snippets: List[str] = Field(default_factory=list)
+    evidence_snippets: List[str] = field(default_factory=list)
 
-class Tax(BaseModel):
+@dataclass(slots=True)
+class Tax:
     tax_returns_present: bool = False
     tax_audits_disputes_present: bool = False
     withholding_present: bool = False
     vat_gst_present: bool = False
     transfer_pricing_present: bool = False
     tax_indemnity_covenant_present: bool = False
-    evidence_snippets: List[str] = Field(default_factory=list)
+    evidence_snippets: List[str] = field(default_factory=list)
 
-class LitigationAndAllegations(BaseModel):
+@dataclass(slots=True)
+class LitigationAndAllegations:
     litigation_present: bool = False
     allegations_accusations_present: bool = False
     regulatory_investigation_present: bool = False
@@ -142,9 +167,10 @@ class LitigationAndAllegations(BaseModel):
     settlement_consent_order_present: bool = False
     contingent_liability_reserves_present: bool = False
     whistleblower_internal_investigation_present: bool = False
-    evidence_snippets: List[str] = Field(default_factory=list)
+    evidence_snippets: List[str] = field(default_factory=list)
 
-class Compliance(BaseModel):
+@dataclass(slots=True)
+class Compliance:
     anti_bribery_present: bool = False
     aml_kyc_sanctions_present: bool = False
     competition_antitrust_present: bool = False
@@ -152,9 +178,10 @@ class Compliance(BaseModel):
     cybersecurity_breach_present: bool = False
     export_controls_present: bool = False
     environment_hs_present: bool = False
-    evidence_snippets: List[str] = Field(default_factory=list)
+    evidence_snippets: List[str] = field(default_factory=list)
 
-class EvidenceStrength(BaseModel):
+@dataclass(slots=True)
+class EvidenceStrength:
     numbers_present: bool = False
     dates_present: bool = False
     percentages_present: bool = False
@@ -173,6 +200,14 @@ class Flags(BaseModel):
     generic_language_without_details: bool = False
     unsupported_no_litigation_claim: bool = False
 
+def _set_fields(model: BaseModel, **values: Any) -> None:
+    """
+    Assign already-valid values to a model's fields in one update.
+    Skips BaseModel.__setattr__; the models here do not validate on assignment anyway.
+    """
+    model.__dict__.update(values)
+    model.__pydantic_fields_set__.update(values)
+
 class DealCompletenessAnalysis(BaseModel):
     """
     Comprehensive deal document analysis schema with completeness validation.
@@ -196,13 +231,22 @@ class DealCompletenessAnalysis(BaseModel):
     scores: Scores = Field(default_factory=Scores)
     flags: Flags = Field(default_factory=Flags)
 
-    def calculate_bucket_coverage(self) -> int:
+    def calculate_bucket_coverage(self, mask: int | None = None) -> int:
         """Calculate bucket coverage score (0-70 points) using 7 core buckets."""
-        
-        # Define core buckets with minimum hit requirements
-        core_buckets = [
+        if mask is None:
+            mask = self._compute_bucket_mask()
+
+        # Each bucket present = 10 points, max = 70
+        return mask.bit_count() * 10
+
+    def _compute_bucket_mask(self, any_date: bool | None = None, parties: int | None = None) -> int:
+        """
+        Evaluate the 7 core buckets once and pack them into an int.
+        Bit i is set when core bucket i passes (A, B, C, E, G, H, K in that order).
+        """
+        core_buckets = (
             # Bucket A: Deal identity (2+ hits required)
-            self._bucket_a_deal_identity(),
+            self._bucket_a_deal_identity(any_date, parties),
             
             # Bucket B: Price/payment (2+ hits required)  
             self._bucket_b_price_payment(),
@@ -221,149 +265,160 @@ class DealCompletenessAnalysis(BaseModel):
             
             # Bucket K: Litigation/allegations (2+ hits required)
             self._bucket_k_litigation_allegations()
-        ]
-        
-        # Each bucket present = 10 points, max = 70
-        return sum(core_buckets) * 10
-
-    def _bucket_a_deal_identity(self) -> bool:
+        )
+        mask = 0
+        for i, present in enumerate(core_buckets):
+            if present:
+                mask |= 1 << i
+        return mask
+
+    # Each bucket needs 2+ hits. The checks add flags a pair at a time and return as soon
+    # as two are seen, so well-populated sections only read their first few fields.
+    def _bucket_a_deal_identity(self, any_date: bool | None = None, parties: int | None = None) -> bool:
         """Bucket A: Deal identity - needs 2+ hits"""
-        hits = [
-            bool(self.entities.buyer.name),
-            bool(self.entities.seller.name), 
-            bool(self.entities.target.name),
-            self.deal.structure != "unknown",
-            bool(self.deal.signing_date or self.deal.closing_date or self.deal.effective_date),
-            bool(self.deal.governing_law),
-            self.deal.defined_terms_present
-        ]
-        return sum(hits) >= 2
+        if parties is None:
+            parties = self._party_count()
+        if parties >= 2:
+            return True
+        if any_date is None:
+            any_date = self._has_deal_date()
+        deal = self.deal
+        n = parties + (deal.structure != "unknown")
+        if n >= 2:
+            return True
+        n += any_date + bool(deal.governing_law)
+        if n >= 2:
+            return True
+        return n + deal.defined_terms_present >= 2
 
     def _bucket_b_price_payment(self) -> bool:
         """Bucket B: Price/payment - needs 2+ hits"""
-        hits = [
-            self.price_and_payment.purchase_price_present,
-            self.price_and_payment.currency_present,
-            self.price_and_payment.enterprise_value_present,
-            self.price_and_payment.equity_value_present,
-            self.price_and_payment.adjustment_mechanism_present,
-            self.price_and_payment.earnout_present,
-            self.price_and_payment.escrow_holdback_present,
-            self.price_and_payment.payment_form != "unknown"
-        ]
-        return sum(hits) >= 2
+        pp = self.price_and_payment
+        n = pp.purchase_price_present + pp.currency_present
+        if n >= 2:
+            return True
+        n += pp.enterprise_value_present + pp.equity_value_present
+        if n >= 2:
+            return True
+        n += pp.adjustment_mechanism_present + pp.earnout_present
+        if n >= 2:
+            return True
+        return n + pp.escrow_holdback_present + (pp.payment_form != "unknown") >= 2
 
     def _bucket_c_reps_warranties(self) -> bool:
         """Bucket C: Reps & warranties - needs 2+ hits"""
-        rep_topic_hits = sum([
-            self.reps_and_warranties.rep_topics_hit.authority_organisation,
-            self.reps_and_warranties.rep_topics_hit.financial_statements,
-            self.reps_and_warranties.rep_topics_hit.litigation_investigations,
-            self.reps_and_warranties.rep_topics_hit.compliance_with_laws,
-            self.reps_and_warranties.rep_topics_hit.material_contracts,
-            self.reps_and_warranties.rep_topics_hit.tax,
-            self.reps_and_warranties.rep_topics_hit.employment_benefits
-        ])
+        rw = self.reps_and_warranties
+        n = rw.section_present + rw.disclosure_schedules_present
+        if n >= 2:
+            return True
+        n += rw.mae_mac_present + rw.knowledge_qualifiers_present
+        if n >= 2:
+            return True
+        if n == 0:
+            return False
         
-        hits = [
-            self.reps_and_warranties.section_present,
-            self.reps_and_warranties.disclosure_schedules_present,
-            self.reps_and_warranties.mae_mac_present,
-            self.reps_and_warranties.knowledge_qualifiers_present,
-            rep_topic_hits >= 3  # Multiple rep topics count as 1 hit
-        ]
-        return sum(hits) >= 2
+        # Multiple rep topics count as 1 hit
+        rt = rw.rep_topics_hit
+        rep_topic_hits = (
+            rt.authority_organisation + rt.financial_statements + rt.litigation_investigations +
+            rt.compliance_with_laws + rt.material_contracts + rt.tax + rt.employment_benefits
+        )
+        return rep_topic_hits >= 3
 
     def _bucket_e_closing_conditions(self) -> bool:
         """Bucket E: Closing conditions - needs 2+ hits"""
-        hits = [
-            self.closing_conditions.section_present,
-            self.closing_conditions.regulatory_approvals_present,
-            self.closing_conditions.third_party_consents_present,
-            self.closing_conditions.shareholder_board_approval_present,
-            self.closing_conditions.bring_down_present,
-            self.closing_conditions.deliverables_present,
-            self.closing_conditions.no_injunction_present
-        ]
-        return sum(hits) >= 2
+        cc = self.closing_conditions
+        n = cc.section_present + cc.regulatory_approvals_present
+        if n >= 2:
+            return True
+        n += cc.third_party_consents_present + cc.shareholder_board_approval_present
+        if n >= 2:
+            return True
+        n += cc.bring_down_present + cc.deliverables_present
+        if n >= 2:
+            return True
+        return n + cc.no_injunction_present >= 2
 
     def _bucket_g_indemnities_limits(self) -> bool:
         """Bucket G: Indemnities & limits - needs 2+ hits"""
-        hits = [
-            self.indemnities_and_limits.indemnity_present,
-            self.indemnities_and_limits.survival_present,
-            self.indemnities_and_limits.basket_present,
-            self.indemnities_and_limits.cap_present,
-            self.indemnities_and_limits.fraud_carveout_present,
-            self.indemnities_and_limits.escrow_claims_process_present,
-            self.indemnities_and_limits.rwi_present
-        ]
-        return sum(hits) >= 2
+        il = self.indemnities_and_limits
+        n = il.indemnity_present + il.survival_present
+        if n >= 2:
+            return True
+        n += il.basket_present + il.cap_present
+        if n >= 2:
+            return True
+        n += il.fraud_carveout_present + il.escrow_claims_process_present
+        if n >= 2:
+            return True
+        return n + il.rwi_present >= 2
 
     def _bucket_h_financials(self) -> bool:
         """Bucket H: Financials - needs 2+ hits"""
-        hits = [
-            self.financials.financial_statements_present,
-            self.financials.audited_unaudited_present,
-            self.financials.ebitda_present,
-            self.financials.revenue_recognition_present,
-            self.financials.forecast_budget_present,
-            self.financials.qoe_present,
-            self.capital_and_debt.cap_table_present,
-            self.capital_and_debt.debt_facility_present
-        ]
-        return sum(hits) >= 2
+        fin = self.financials
+        n = fin.financial_statements_present + fin.audited_unaudited_present
+        if n >= 2:
+            return True
+        n += fin.ebitda_present + fin.revenue_recognition_present
+        if n >= 2:
+            return True
+        n += fin.forecast_budget_present + fin.qoe_present
+        if n >= 2:
+            return True
+        cd = self.capital_and_debt
+        return n + cd.cap_table_present + cd.debt_facility_present >= 2
 
     def _bucket_k_litigation_allegations(self) -> bool:
         """Bucket K: Litigation/allegations - needs 2+ hits"""
-        hits = [
-            self.litigation_and_allegations.litigation_present,
-            self.litigation_and_allegations.allegations_accusations_present,
-            self.litigation_and_allegations.regulatory_investigation_present,
-            self.litigation_and_allegations.settlement_consent_order_present,
-            self.litigation_and_allegations.whistleblower_internal_investigation_present,
-            self.compliance.anti_bribery_present,
-            self.compliance.aml_kyc_sanctions_present,
-            self.compliance.competition_antitrust_present
-        ]
-        return sum(hits) >= 2
-
-    def calculate_evidence_strength(self) -> int:
+        lit = self.litigation_and_allegations
+        n = lit.litigation_present + lit.allegations_accusations_present
+        if n >= 2:
+            return True
+        n += lit.regulatory_investigation_present + lit.settlement_consent_order_present
+        if n >= 2:
+            return True
+        comp = self.compliance
+        n += lit.whistleblower_internal_investigation_present + comp.anti_bribery_present
+        if n >= 2:
+            return True
+        return n + comp.aml_kyc_sanctions_present + comp.competition_antitrust_present >= 2
+
+    def _party_count(self) -> int:
+        """How many of the buyer, seller and target names were found."""
+        ent = self.entities
+        return bool(ent.buyer.name) + bool(ent.seller.name) + bool(ent.target.name)
+
+    def _has_deal_date(self) -> bool:
+        """Whether any of the signing, closing or effective dates was found."""
+        deal = self.deal
+        return bool(deal.signing_date or deal.closing_date or deal.effective_date)
+
+    def calculate_evidence_strength(self, any_date: bool | None = None) -> int:
         """Calculate evidence strength score (0-30 points) based on hard-to-fake details."""
-        score = 0
+        if any_date is None:
+            any_date = self._has_deal_date()
+        es = self.evidence_strength
+        deal = self.deal
         
-        # Currency or price-format present = +6
-        if self.price_and_payment.currency_present or self.evidence_strength.numbers_present:
-            score += 6
-            
-        # Dates present = +6  
-        if (self.evidence_strength.dates_present or 
-            bool(self.deal.signing_date or self.deal.closing_date or self.deal.effective_date)):
-            score += 6
-            
-        # Percentages present = +4
-        if self.evidence_strength.percentages_present:
-            score += 4
-            
-        # Defined-term pattern present = +7
-        if self.evidence_strength.defined_term_pattern_present or self.deal.defined_terms_present:
-            score += 7
-            
-        # Schedule/exhibit pattern present = +7
-        if self.evidence_strength.schedule_exhibit_pattern_present or self.deal.schedule_or_exhibit_refs_present:
-            score += 7
-            
+        score = (
+            # Currency or price-format present = +6
+            6 * (self.price_and_payment.currency_present or es.numbers_present) +
+            # Dates present = +6
+            6 * (es.dates_present or any_date) +
+            # Percentages present = +4
+            4 * es.percentages_present +
+            # Defined-term pattern present = +7
+            7 * (es.defined_term_pattern_present or deal.defined_terms_present) +
+            # Schedule/exhibit pattern present = +7
+            7 * (es.schedule_exhibit_pattern_present or deal.schedule_or_exhibit_refs_present)
+        )
         return min(score, 30)  # Max = 30
             
-    def check_hard_fail_rules(self) -> Tuple[bool, str]:
+    def check_hard_fail_rules(self, parties: int | None = None) -> Tuple[bool, str]:
         """Check hard fail (instant reject) rules that bypass normal scoring."""
         
         # Rule 1: No parties - at least 2 of 3 party names must be present
-        parties_present = sum([
-            bool(self.entities.buyer.name),
-            bool(self.entities.seller.name), 
-            bool(self.entities.target.name)
-        ])
+        parties_present = self._party_count() if parties is None else parties
         if parties_present < 2:
             return True, "No parties: Buyer/seller/target names not found (at least 2 of 3 missing)"
             
@@ -393,86 +448,99 @@ class DealCompletenessAnalysis(BaseModel):
             
         return False, ""
 
-    def detect_teaser_or_loi(self) -> bool:
+    def detect_teaser_or_loi(self, mask: int | None = None) -> bool:
         """Detect if document is likely a teaser or LOI (soft flag)."""
         
-        # Check for teaser/LOI keywords
-        is_teaser_type = self.doc_meta.doc_type_guess in ["teaser", "loi", "term_sheet", "other"]
+        # Check for teaser/LOI keywords; other document types never need the bucket checks
+        if self.doc_meta.doc_type_guess not in _TEASER_TYPES:
+            return False
+        if mask is None:
+            mask = self._compute_bucket_mask()
         
         # Missing critical sections (Indemnities AND (Closing conditions OR Reps))
-        missing_indemnities = not self._bucket_g_indemnities_limits()
-        missing_closing_or_reps = (not self._bucket_e_closing_conditions() or 
-                                  not self._bucket_c_reps_warranties())
+        missing_indemnities = not mask & _BUCKET_G
+        missing_closing_or_reps = (mask & (_BUCKET_C | _BUCKET_E)) != (_BUCKET_C | _BUCKET_E)
         
-        return is_teaser_type and missing_indemnities and missing_closing_or_reps
+        return missing_indemnities and missing_closing_or_reps
 
     def validate_completeness(self) -> None:
         """Apply completeness rules with precise 0-100 scoring and hard fail rules."""
         
+        # Party names feed both the hard fail rules and bucket A; count them once
+        parties = self._party_count()
+        
         # Check hard fail rules first (instant reject regardless of score)
-        hard_fail, hard_fail_reason = self.check_hard_fail_rules()
+        hard_fail, hard_fail_reason = self.check_hard_fail_rules(parties)
         if hard_fail:
-            self.scores.bucket_coverage_score = 0
-            self.scores.evidence_strength_score = 0
-            self.scores.overall_score = 0
-            self.scores.classification = "reject_incomplete"
-            self.flags.likely_teaser_or_summary = True
-            self.flags.missing_core_buckets = ["HARD_FAIL: " + hard_fail_reason]
+            _set_fields(
+                self.scores,
+                bucket_coverage_score=0,
+                evidence_strength_score=0,
+                overall_score=0,
+                classification="reject_incomplete",
+            )
+            _set_fields(
+                self.flags,
+                likely_teaser_or_summary=True,
+                missing_core_buckets=["HARD_FAIL: " + hard_fail_reason],
+            )
             return
         
+        # Evaluate the deal dates and each core bucket once; the scores, missing buckets
+        # and the teaser check all share them
+        any_date = self._has_deal_date()
+        mask = self._compute_bucket_mask(any_date, parties)
+
         # Calculate scores (0-100 scale)
-        self.scores.bucket_coverage_score = self.calculate_bucket_coverage()  # 0-70
-        self.scores.evidence_strength_score = self.calculate_evidence_strength()  # 0-30
-        self.scores.overall_score = self.scores.bucket_coverage_score + self.scores.evidence_strength_score  # 0-100
+        bucket_coverage_score = self.calculate_bucket_coverage(mask)  # 0-70
+        evidence_strength_score = self.calculate_evidence_strength(any_date)  # 0-30
+        overall_score = bucket_coverage_score + evidence_strength_score  # 0-100
 
         # Identify missing core buckets for reporting
-        bucket_names = [
-            "deal_identity", "price_payment", "reps_warranties", 
-            "closing_conditions", "indemnities_limits", 
-            "financials", "litigation_claims"
-        ]
-        
-        bucket_results = [
-            self._bucket_a_deal_identity(),
-            self._bucket_b_price_payment(),
-            self._bucket_c_reps_warranties(),
-            self._bucket_e_closing_conditions(),
-            self._bucket_g_indemnities_limits(),
-            self._bucket_h_financials(),
-            self._bucket_k_litigation_allegations()
-        ]
-        
-        self.flags.missing_core_buckets = [
-            bucket_names[i] for i, present in enumerate(bucket_results) if not present
-        ]
+        flags = {
+            "missing_core_buckets": [
+                name for i, name in enumerate(_BUCKET_NAMES) if not (mask >> i) & 1
+            ]
+        }
 
         # Apply scoring-based classification rules
-        if self.scores.overall_score < 50:
+        if overall_score < 50:
             # 0-49 → reject_incomplete
-            self.scores.classification = "reject_incomplete"
-        elif self.scores.overall_score < 70:
+            classification = "reject_incomplete"
+        elif overall_score < 70:
             # 50-69 → accept_with_warnings  
-            self.scores.classification = "accept_with_warnings"
+            classification = "accept_with_warnings"
         else:
             # 70-100 → accept_ok
-            self.scores.classification = "accept_ok"
+            classification = "accept_ok"
         
         # Check for teaser/LOI detection (soft flag)
-        self.flags.likely_teaser_or_summary = self.detect_teaser_or_loi()
+        flags["likely_teaser_or_summary"] = likely_teaser = self.detect_teaser_or_loi(mask)
         
         # If likely teaser, force accept_with_warnings at best
-        if self.flags.likely_teaser_or_summary and self.scores.classification == "accept_ok":
-            self.scores.classification = "accept_with_warnings"
+        if likely_teaser and classification == "accept_ok":
+            classification = "accept_with_warnings"
 
         # Check for additional red flags
-        if (not self.evidence_strength.numbers_present and 
-            not self.evidence_strength.dates_present and 
-            not self.evidence_strength.schedule_exhibit_pattern_present and
-            not self.evidence_strength.defined_term_pattern_present and
-            self.scores.bucket_coverage_score > 0):
-            self.flags.generic_language_without_details = True
+        es = self.evidence_strength
+        if (not es.numbers_present and 
+            not es.dates_present and 
+            not es.schedule_exhibit_pattern_present and
+            not es.defined_term_pattern_present and
+            bucket_coverage_score > 0):
+            flags["generic_language_without_details"] = True
 
         if (not self.litigation_and_allegations.litigation_present and 
             not self.deal.schedule_or_exhibit_refs_present and
             not self.reps_and_warranties.disclosure_schedules_present):
-            self.flags.unsupported_no_litigation_claim = True
+            flags["unsupported_no_litigation_claim"] = True
+
+        # Write the results back in one go per model
+        _set_fields(
+            self.scores,
+            bucket_coverage_score=bucket_coverage_score,
+            evidence_strength_score=evidence_strength_score,
+            overall_score=overall_score,
+            classification=classification,
+        )
+        _set_fields(self.flags, **flags)
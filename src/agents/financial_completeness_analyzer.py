@@ -2,9 +2,26 @@
 Financial document completeness analyzer.
 Analyzes financial spreadsheets and reports for completeness using financial-specific criteria.
 """
+import hashlib
+import os
 import re
-from typing import Dict, List, Tuple
-from pathlib import Path
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Set, Tuple
+
+from pydantic import BaseModel
+
+try:
+    import ahocorasick  # optional: one-pass multi-keyword matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2  # optional: linear-time DFA matching
+except ImportError:
+    re2 = None
 
 from src.agents.financial_completeness_schema import (
     FinancialCompletenessAnalysis,
@@ -17,83 +34,319 @@ from src.agents.financial_completeness_schema import (
     FinancialCompletenessFlags,
 )
 
+# Recent analyze_document results keyed by (text digest, file extension); the extension is
+# the only part of the filename the analysis depends on
+ANALYSIS_CACHE_SIZE = 128
+_analysis_cache: OrderedDict[Tuple[bytes, str], FinancialCompletenessAnalysis] = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+# Financial statement sheet name patterns
+_STATEMENT_PATTERNS = MappingProxyType({
+    "profit_and_loss": (
+        r"profit.*loss", r"p\s*&\s*l", r"income.*statement", r"pnl", 
+        r"statement.*income", r"profit.*account", r"trading.*account",
+        r"revenue.*account", r"pl\s+statement", r"income.*expenses"
+    ),
+    "balance_sheet": (
+        r"balance.*sheet", r"b\s*/\s*s", r"bs", r"financial.*position",
+        r"statement.*financial.*position", r"assets.*liabilities",
+        r"balance.*statement"
+    ),
+    "cash_flow": (
+        r"cash.*flow", r"cashflow", r"c\s*/\s*f", r"cf", r"cash.*statement",
+        r"statement.*cash.*flow", r"fund.*flow"
+    )
+})
+
+# Performance metrics keywords
+_PERFORMANCE_KEYWORDS = MappingProxyType({
+    "sales_revenue": (
+        r"sales", r"revenue", r"turnover", r"income from operations",
+        r"gross revenue", r"net sales", r"operating revenue", r"total income",
+        r"sale of goods", r"service revenue"
+    ),
+    "expenses": (
+        r"expenses", r"cost of goods sold", r"cogs", r"operating expenses",
+        r"administrative expenses", r"selling expenses", r"total expenses",
+        r"cost of sales", r"opex", r"overheads", r"expenditure"
+    ),
+    "net_profit": (
+        r"net profit", r"net income", r"pat", r"profit after tax",
+        r"net earnings", r"bottom line", r"profit for the year",
+        r"comprehensive income"
+    ),
+    "eps": (
+        r"earnings per share", r"eps", r"basic eps", r"diluted eps",
+        r"earning per equity share"
+    ),
+    "ebitda": (
+        r"ebitda", r"ebit", r"operating profit", r"operating income",
+        r"profit before interest", r"earnings before"
+    )
+})
+
+# Period/date patterns
+_PERIOD_PATTERNS = (
+    r"fy\s*\d{4}", r"financial year", r"fy ending", r"year ended",
+    r"march\s*\d{4}", r"31st march", r"31-mar", r"march 31",
+    r"q[1-4]\s*fy\s*\d{2,4}", r"quarter", r"quarterly", r"half.*year",
+    r"2019|2020|2021|2022|2023|2024", r"h1\s*fy", r"h2\s*fy"
+)
+
+# Numeric content patterns
+_NUMERIC_PATTERNS = (
+    r"₹[\d,]+", r"rs\.?\s*[\d,]+", r"inr[\d,]+",  # Currency
+    r"\$[\d,]+", r"usd[\d,]+",  # USD
+    r"[\d,]+\.?\d*\s*crore", r"[\d,]+\.?\d*\s*lakh",  # Indian units
+    r"\d+\.\d+%", r"\d+%",  # Percentages
+    r"\b\d{1,3}(?:,\d{3})*(?:\.\d{2})?\b"  # Large numbers with commas
+)
+
+# Period evidence patterns; more specific and discriminating than _PERIOD_PATTERNS
+_FY_PATTERNS = (r"fy\s*(?:20\d{2}|1\d{3})", r"financial year.*(?:20\d{2}|1\d{3})", r"year.*end.*(?:20\d{2}|1\d{3})")
+_QUARTERLY_PATTERNS = (r"q[1-4].*(?:20\d{2}|fy)", r"quarter.*(?:end|20\d{2})", r"half.*year.*(?:20\d{2})")
+_YEAR_PATTERNS = (r"\b20[1-2]\d\b", r"\b1[89]\d{2}\b")  # More specific year patterns
+_MONTH_PATTERNS = (r"march.*20\d{2}", r"mar.*20\d{2}", r"31.*march", r"31-mar")
+
+def _is_literal(pattern: str) -> bool:
+    return not any(c in pattern for c in "\\.^$*+?{}[]|()")
+
+def _literal_keyword_categories() -> Dict[str, Tuple[str, ...]]:
+    table: Dict[str, Tuple[str, ...]] = {}
+    for category, patterns in (*_STATEMENT_PATTERNS.items(), *_PERFORMANCE_KEYWORDS.items()):
+        for pattern in patterns:
+            if _is_literal(pattern):
+                table[pattern] = table.get(pattern, ()) + (category,)
+    return table
+
+# Plain-phrase statement/performance keywords, mapped to the categories they indicate.
+# These are found with one keyword pass; only the real regexes are searched separately.
+_KEYWORD_CATEGORIES = _literal_keyword_categories()
+# ...and the other way round, for looking up a few categories on their own
+_CATEGORY_KEYWORDS = MappingProxyType({
+    category: tuple(k for k, categories in _KEYWORD_CATEGORIES.items() if category in categories)
+    for category in (*_STATEMENT_PATTERNS, *_PERFORMANCE_KEYWORDS)
+})
+_CATEGORY_COUNT = len(_STATEMENT_PATTERNS) + len(_PERFORMANCE_KEYWORDS)
+
+def _build_keyword_automaton():
+    """One read-only automaton over the literal keywords, or None without pyahocorasick."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, categories in _KEYWORD_CATEGORIES.items():
+        automaton.add_word(keyword, categories)
+    automaton.make_automaton()
+    return automaton
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+def _compile_bytes(pattern: str):
+    # Patterns are lowercase and run on the lowercased text, so none needs case folding.
+    # google-re2 matches bytes patterns in UTF-8 mode.
+    if re2 is not None:
+        return re2.compile(pattern.encode("utf-8"))
+    return re.compile(pattern.encode("utf-8"))
+
+# Pattern parts that match any amount of text, so the literals between them are each required
+_GAP_RE = re.compile(r"\.\*|\\s[*+]|\\b")
+
+def _required_literals(pattern: str) -> Tuple[bytes, ...]:
+    """Literal runs every match of `pattern` contains (lowercased), or () when none are known."""
+    if "|" in re.sub(r"\([^()]*\)", "", pattern):
+        return ()  # a top-level alternative need not contain any of them
+    return tuple(part.lower().encode("utf-8") for part in _GAP_RE.split(pattern) if part and _is_literal(part))
+
+class _GatedPattern:
+    """
+    A compiled pattern behind substring checks: search only runs when the subject contains
+    every literal the pattern requires. `in` rejects a text lacking e.g. "flow" far faster
+    than the regex can, which retries .*flow from every "cash".
+    """
+    __slots__ = ("pattern", "required")
+
+    def __init__(self, pattern, required: Tuple[bytes, ...]):
+        self.pattern = pattern
+        self.required = required
+
+    def search(self, subject: bytes):
+        if all(literal in subject for literal in self.required):
+            return self.pattern.search(subject)
+        return None
+
+def _gated(source: str):
+    """_compile_bytes(source), gated on the literals it requires when it has any."""
+    pattern = _compile_bytes(source)
+    required = _required_literals(source)
+    return _GatedPattern(pattern, required) if required else pattern
+
+def _compile_group(patterns: Tuple[str, ...]) -> tuple:
+    """
+    Compile the patterns of one check; the check passes if any of them matches.
+    With re2 they are joined into a single alternation and found in one DFA pass. stdlib re
+    searches them one by one, which it does faster than an alternation (it loses the
+    literal-prefix scan of patterns like profit.*loss inside one), each gated on the literals
+    it requires. A gate would only add passes in front of re2's single one.
+    """
+    if not patterns:
+        return ()
+    if re2 is not None:
+        return (_compile_bytes("|".join(f"(?:{p})" for p in patterns)),)
+    return tuple(_gated(p) for p in patterns)
+
+# Compiled once at import instead of looked up in the re cache on every search.
+# Patterns run against the lowercased text are compiled as bytes and matched on its UTF-8
+# encoding: SRE scans bytes one unit at a time, while text containing characters like ₹
+# or curly quotes is stored (and scanned) as 2-byte units.
+_STATEMENT_RES = MappingProxyType({
+    k: _compile_group(tuple(p for p in v if not _is_literal(p)))
+    for k, v in _STATEMENT_PATTERNS.items()
+})
+_PERFORMANCE_RES = MappingProxyType({
+    k: _compile_group(tuple(p for p in v if not _is_literal(p)))
+    for k, v in _PERFORMANCE_KEYWORDS.items()
+})
+_NOTES_RE = _compile_bytes(r"notes?.*to.*financial|notes?.*to.*accounts|significant.*accounting")
+_FY_RES = _compile_group(_FY_PATTERNS)
+_QUARTERLY_RES = _compile_group(_QUARTERLY_PATTERNS)
+_YEAR_RES = tuple(re.compile(p) for p in _YEAR_PATTERNS)
+_MONTH_RES = _compile_group(_MONTH_PATTERNS)
+_CURRENCY_RES = tuple(re.compile(p, re.IGNORECASE) for p in _NUMERIC_PATTERNS[:3])
+# \d+\.?\d*% backtracks cubically through a digit run with no % after it (seconds for one
+# 500-digit run). re2 scans it, and the data-row pattern, in linear time; they run on the
+# UTF-8 bytes (its str API rejects lone surrogates), with \p{Nd} for the Unicode digits \d
+# stands for in str patterns. Without re2 a percentage may only start at the first digit
+# of a run, where it would anyway.
+if re2 is not None:
+    _PERCENTAGE_RE = re2.compile(rb"\p{Nd}+\.?\p{Nd}*%")
+    _DATA_ROW_RE = re2.compile(rb"(?m)^[^\n]*?\p{Nd}{3}")
+else:
+    _PERCENTAGE_RE = re.compile(r"\d(?<!\d\d)\d*(?:\.\d*)?%")
+    _DATA_ROW_RE = re.compile(r'^[^\n]*?\d{3}', re.MULTILINE)  # one match per line with a 3+ digit run
+# The lookahead rejects all-zero values; 0+(?:\.0*)? is 0+\.?0* without the quadratic retries
+_MEANINGFUL_NUMBER_RE = re.compile(r"\b(?!0+(?:\.0*)?\b)\d{1,}(?:[,\.]\d+)*\b")
+_ZERO_CURRENCY_RE = re.compile(r'.*0+\.?0*.*')
+_RATIO_RES = (re.compile(r"\b\d+\.\d{2,}\b"), re.compile(r"\b\d+:\d+\b"))  # More specific ratios
+
+# Performance metrics score by number of metrics found (0-5)
+_PERFORMANCE_POINTS = (0, 10, 20, 25, 25, 25)
+_MAX_PERIOD_SCORE = 25
+_MAX_NUMERIC_SCORE = 20
+# Totals below this are rejected whichever way the flags go
+_REJECT_BELOW = 40
+
+_SPREADSHEET_EXTENSIONS = frozenset({"xlsx", "xls", "csv"})
+
+# Sections of the analysis, each produced by one analyzer method
+_SECTIONS = ("statements", "performance", "periods", "numeric")
+# Order sections are analyzed in with early_exit, checking the verdict after each stage
+_EARLY_EXIT_STAGES = (("statements", "performance"), ("periods",), ("numeric",))
+
+# Documents longer than SAMPLE_MIN_CHARS are first analyzed on their first and last
+# SAMPLE_CHARS characters (cut at line breaks): statements and headline figures are
+# usually near the top, notes near the end
+SAMPLE_CHARS = 64 * 1024
+SAMPLE_MIN_CHARS = 8 * SAMPLE_CHARS
+# Joins head and tail: a NUL line that no pattern (.*, \s, \d or \b) can match across,
+# so the sample has no match the document lacks
+_SAMPLE_SEPARATOR = "\n\x00\n"
+
+def _head_and_tail(text: str) -> str | None:
+    """Whole first and last lines within SAMPLE_CHARS of each end, or None for short texts."""
+    if len(text) <= SAMPLE_MIN_CHARS:
+        return None
+    head_end = text.rfind("\n", 0, SAMPLE_CHARS) + 1
+    tail_start = text.find("\n", len(text) - SAMPLE_CHARS) + 1
+    tail = text[tail_start:] if tail_start else ""
+    return text[:head_end] + _SAMPLE_SEPARATOR + tail
+
+def _extension(filename: str) -> str:
+    """Lowercased extension without the dot; same rules as Path.suffix (dotfiles have none)."""
+    stem, _, ext = filename.rpartition("/")[2].rpartition(".")
+    return ext.lower() if stem else ""
+
+def _encode(text: str) -> bytes:
+    return text.encode("utf-8", "replace")
+
+def _iter_matches(patterns: Tuple[re.Pattern, ...], text: str) -> Iterator[re.Match]:
+    """Lazily yield the matches of each pattern in turn."""
+    for pattern in patterns:
+        yield from pattern.finditer(text)
+
+def _count_matches(patterns: Tuple[re.Pattern, ...], text: str, limit: int) -> int:
+    """Count matches across patterns, stopping once `limit` is reached."""
+    count = 0
+    for _ in _iter_matches(patterns, text):
+        count += 1
+        if count >= limit:
+            break
+    return count
+
 class FinancialCompletenessAnalyzer:
     """Analyzer for financial document completeness validation"""
     
     def __init__(self):
-        # Financial statement sheet name patterns
-        self.statement_patterns = {
-            "profit_and_loss": [
-                r"profit.*loss", r"p\s*&\s*l", r"income.*statement", r"pnl", 
-                r"statement.*income", r"profit.*account", r"trading.*account",
-                r"revenue.*account", r"pl\s+statement", r"income.*expenses"
-            ],
-            "balance_sheet": [
-                r"balance.*sheet", r"b\s*/\s*s", r"bs", r"financial.*position",
-                r"statement.*financial.*position", r"assets.*liabilities",
-                r"balance.*statement"
-            ],
-            "cash_flow": [
-                r"cash.*flow", r"cashflow", r"c\s*/\s*f", r"cf", r"cash.*statement",
-                r"statement.*cash.*flow", r"fund.*flow"
-            ]
-        }
-        
-        # Performance metrics keywords
-        self.performance_keywords = {
-            "sales_revenue": [
-                r"sales", r"revenue", r"turnover", r"income from operations",
-                r"gross revenue", r"net sales", r"operating revenue", r"total income",
-                r"sale of goods", r"service revenue"
-            ],
-            "expenses": [
-                r"expenses", r"cost of goods sold", r"cogs", r"operating expenses",
-                r"administrative expenses", r"selling expenses", r"total expenses",
-                r"cost of sales", r"opex", r"overheads", r"expenditure"
-            ],
-            "net_profit": [
-                r"net profit", r"net income", r"pat", r"profit after tax",
-                r"net earnings", r"bottom line", r"profit for the year",
-                r"comprehensive income"
-            ],
-            "eps": [
-                r"earnings per share", r"eps", r"basic eps", r"diluted eps",
-                r"earning per equity share"
-            ],
-            "ebitda": [
-                r"ebitda", r"ebit", r"operating profit", r"operating income",
-                r"profit before interest", r"earnings before"
-            ]
-        }
-        
-        # Period/date patterns
-        self.period_patterns = [
-            r"fy\s*\d{4}", r"financial year", r"fy ending", r"year ended",
-            r"march\s*\d{4}", r"31st march", r"31-mar", r"march 31",
-            r"q[1-4]\s*fy\s*\d{2,4}", r"quarter", r"quarterly", r"half.*year",
-            r"2019|2020|2021|2022|2023|2024", r"h1\s*fy", r"h2\s*fy"
-        ]
-        
-        # Numeric content patterns
-        self.numeric_patterns = [
-            r"₹[\d,]+", r"rs\.?\s*[\d,]+", r"inr[\d,]+",  # Currency
-            r"\$[\d,]+", r"usd[\d,]+",  # USD
-            r"[\d,]+\.?\d*\s*crore", r"[\d,]+\.?\d*\s*lakh",  # Indian units
-            r"\d+\.\d+%", r"\d+%",  # Percentages
-            r"\b\d{1,3}(?:,\d{3})*(?:\.\d{2})?\b"  # Large numbers with commas
-        ]
-
-    def analyze_document(self, filename: str, text: str) -> FinancialCompletenessAnalysis:
-        """Main entry point for financial document analysis"""
+        # Module-level constants are shared by every instance; construction only binds them
+        self.statement_patterns = _STATEMENT_PATTERNS
+        self.performance_keywords = _PERFORMANCE_KEYWORDS
+        self.period_patterns = _PERIOD_PATTERNS
+        self.numeric_patterns = _NUMERIC_PATTERNS
+
+        self._statement_res = _STATEMENT_RES
+        self._performance_res = _PERFORMANCE_RES
+        self._keyword_automaton = _KEYWORD_AUTOMATON
+
+    def analyze_document(self, filename: str, text: str, early_exit: bool = False) -> FinancialCompletenessAnalysis:
+        """
+        Main entry point for financial document analysis.
+        With early_exit, analysis stops once the document is certain to be rejected (a hard
+        fail, or a score that cannot reach the rejection threshold); sections not analyzed by
+        then are left at their defaults, so only the classification is final.
+        """
+        
+        # Annual reports are often uploaded more than once; serve repeats from cache
+        key = (hashlib.blake2b(_encode(text), digest_size=16).digest(), _extension(filename))
+        with _analysis_cache_lock:
+            cached = _analysis_cache.get(key)
+            if cached is not None:
+                _analysis_cache.move_to_end(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
         
         # Determine document type
         doc_type = self._determine_document_type(filename, text)
         
-        # Analyze different aspects
-        statements = self._analyze_financial_statements(text)
-        performance = self._analyze_performance_metrics(text)
-        periods = self._analyze_period_evidence(text)
-        numeric = self._analyze_numeric_evidence(text)
+        # Every check asks whether something is present, so what a part of the text shows
+        # holds for all of it. Long documents are analyzed on their head and tail first;
+        # only the sections with something still missing are redone on the whole text.
+        sample = _head_and_tail(text)
+        sections: Dict[str, BaseModel] = {}
+        pending, known = _SECTIONS, frozenset()
+        if sample is not None:
+            sections = self._analyze_sections(sample, _SECTIONS)
+            present = {name: result.model_dump() for name, result in sections.items()}
+            pending = tuple(name for name in _SECTIONS if not all(present[name].values()))
+            known = {
+                category
+                for category in _CATEGORY_KEYWORDS
+                if present["statements"].get(f"{category}_present") or present["performance"].get(f"{category}_present")
+            }
+        decided = False
+        if early_exit:
+            for stage in _EARLY_EXIT_STAGES:
+                names = tuple(name for name in stage if name in pending)
+                if names:
+                    sections.update(self._analyze_sections(text, names, known))
+                    pending = tuple(name for name in pending if name not in names)
+                if pending and self._rejected(sections, pending):
+                    decided = True
+                    break
+        elif pending:
+            sections.update(self._analyze_sections(text, pending, known))
+        statements = sections.get("statements", FinancialStatementType())
+        performance = sections.get("performance", PerformanceMetrics())
+        periods = sections.get("periods", PeriodEvidence())
+        numeric = sections.get("numeric", NumericEvidence())
         
         # Calculate scores before creating the analysis object
         scores, flags = self._calculate_scores(statements, performance, periods, numeric)
@@ -108,121 +361,182 @@ class FinancialCompletenessAnalyzer:
             scores=scores,
             flags=flags
         )
-        
+        if decided:
+            return analysis  # partial, so not cached
+        
+        # Cache a private copy so callers are free to modify what they get back
+        with _analysis_cache_lock:
+            _analysis_cache[key] = analysis.model_copy(deep=True)
+            while len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+                _analysis_cache.popitem(last=False)
         return analysis
     
+    def _analyze_sections(self, text: str, names: Tuple[str, ...],
+                          known: Set[str] = frozenset()) -> Dict[str, BaseModel]:
+        """
+        Run the named section analyzers (see _SECTIONS) over `text`. Statement/performance
+        categories in `known` are already established and are not looked for again.
+        """
+        sections: Dict[str, BaseModel] = {}
+        if "numeric" in names:
+            sections["numeric"] = self._analyze_numeric_evidence(text)
+        if names == ("numeric",):
+            return sections
+        
+        # Lowercase (and encode) once and find the literal statement/performance keywords
+        # in one pass; every analyzer below shares them
+        text_lower = text.lower()
+        lower_bytes = _encode(text_lower)
+        if "statements" in names or "performance" in names:
+            found = self._keyword_categories(text_lower, known)
+            if "statements" in names:
+                sections["statements"] = self._analyze_financial_statements(text_lower, found, lower_bytes)
+            if "performance" in names:
+                sections["performance"] = self._analyze_performance_metrics(text_lower, found, lower_bytes)
+        if "periods" in names:
+            sections["periods"] = self._analyze_period_evidence(text, text_lower, lower_bytes)
+        return sections
+    
+    def _rejected(self, sections: Dict[str, BaseModel], pending: Tuple[str, ...]) -> bool:
+        """
+        Whether the sections analyzed so far (all but `pending`) make reject_incomplete the
+        classification whatever the pending ones hold: either a hard fail, or a total that
+        stays under _REJECT_BELOW even if every pending section scores full marks.
+        """
+        if "statements" in pending or "performance" in pending:
+            return False
+        periods_pending = "periods" in pending
+        scores, flags = self._calculate_scores(
+            sections["statements"], sections["performance"],
+            PeriodEvidence() if periods_pending else sections["periods"], NumericEvidence(),
+        )
+        if flags.no_financial_statements and flags.insufficient_performance_metrics:
+            return True
+        best = (
+            scores.financial_statements_score
+            + scores.performance_metrics_score
+            + (_MAX_PERIOD_SCORE if periods_pending else scores.period_evidence_score)
+            + _MAX_NUMERIC_SCORE
+        )
+        return best < _REJECT_BELOW
+    
     def _determine_document_type(self, filename: str, text: str) -> FinancialDocumentType:
         """Determine if document is spreadsheet or report"""
-        ext = Path(filename).suffix.lower()
-        if ext in ['.xlsx', '.xls', '.csv']:
+        if _extension(filename) in _SPREADSHEET_EXTENSIONS:
             return FinancialDocumentType.FINANCIAL_SPREADSHEET
         return FinancialDocumentType.FINANCIAL_REPORT
     
-    def _analyze_financial_statements(self, text: str) -> FinancialStatementType:
+    def _analyze_financial_statements(self, text_lower: str, found: Set[str] | None = None,
+                                      lower_bytes: bytes | None = None) -> FinancialStatementType:
         """Check for presence of core financial statements"""
-        text_lower = text.lower()
+        if found is None:
+            found = self._keyword_categories(text_lower)
+        if lower_bytes is None:
+            lower_bytes = _encode(text_lower)
         
         statements = FinancialStatementType()
         
         # Check for P&L
-        for pattern in self.statement_patterns["profit_and_loss"]:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                statements.profit_and_loss_present = True
-                break
+        statements.profit_and_loss_present = self._category_present("profit_and_loss", self._statement_res, lower_bytes, found)
         
         # Check for Balance Sheet
-        for pattern in self.statement_patterns["balance_sheet"]:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                statements.balance_sheet_present = True
-                break
+        statements.balance_sheet_present = self._category_present("balance_sheet", self._statement_res, lower_bytes, found)
         
         # Check for Cash Flow
-        for pattern in self.statement_patterns["cash_flow"]:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                statements.cash_flow_present = True
-                break
+        statements.cash_flow_present = self._category_present("cash_flow", self._statement_res, lower_bytes, found)
         
         # Check for notes
-        if re.search(r"notes?.*to.*financial|notes?.*to.*accounts|significant.*accounting", text_lower):
+        if _NOTES_RE.search(lower_bytes):
             statements.notes_present = True
         
         return statements
     
-    def _analyze_performance_metrics(self, text: str) -> PerformanceMetrics:
+    def _analyze_performance_metrics(self, text_lower: str, found: Set[str] | None = None,
+                                     lower_bytes: bytes | None = None) -> PerformanceMetrics:
         """Check for presence of key performance metrics"""
-        text_lower = text.lower()
+        if found is None:
+            found = self._keyword_categories(text_lower)
+        if lower_bytes is None:
+            lower_bytes = _encode(text_lower)
         
         metrics = PerformanceMetrics()
         
         # Sales/Revenue
-        for pattern in self.performance_keywords["sales_revenue"]:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                metrics.sales_revenue_present = True
-                break
+        metrics.sales_revenue_present = self._category_present("sales_revenue", self._performance_res, lower_bytes, found)
         
         # Expenses
-        for pattern in self.performance_keywords["expenses"]:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                metrics.expenses_present = True
-                break
+        metrics.expenses_present = self._category_present("expenses", self._performance_res, lower_bytes, found)
         
         # Net Profit
-        for pattern in self.performance_keywords["net_profit"]:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                metrics.net_profit_present = True
-                break
+        metrics.net_profit_present = self._category_present("net_profit", self._performance_res, lower_bytes, found)
         
         # EPS
-        for pattern in self.performance_keywords["eps"]:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                metrics.eps_present = True
-                break
+        metrics.eps_present = self._category_present("eps", self._performance_res, lower_bytes, found)
         
         # EBITDA
-        for pattern in self.performance_keywords["ebitda"]:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                metrics.ebitda_present = True
-                break
+        metrics.ebitda_present = self._category_present("ebitda", self._performance_res, lower_bytes, found)
         
         return metrics
     
-    def _analyze_period_evidence(self, text: str) -> PeriodEvidence:
+    def _keyword_categories(self, text_lower: str, known: Set[str] = frozenset()) -> Set[str]:
+        """
+        Statement/performance categories with a literal keyword in the text, from one pass.
+        Given categories already `known` to be present, only the others are looked up, each
+        keyword on its own; a few substring searches beat a full automaton pass.
+        """
+        if known:
+            return set(known) | {
+                category
+                for category, keywords in _CATEGORY_KEYWORDS.items()
+                if category not in known and any(keyword in text_lower for keyword in keywords)
+            }
+        found: Set[str] = set()
+        if self._keyword_automaton is not None:
+            for _, categories in self._keyword_automaton.iter(text_lower):
+                found.update(categories)
+                if len(found) == _CATEGORY_COUNT:
+                    break
+        else:
+            for keyword, categories in _KEYWORD_CATEGORIES.items():
+                if keyword in text_lower:
+                    found.update(categories)
+        return found
+    
+    def _category_present(self, category: str, regexes: Mapping[str, Tuple[re.Pattern, ...]],
+                          subject: str | bytes, found: Set[str]) -> bool:
+        """A category matches on any of its literal keywords or, failing that, its regex patterns."""
+        return category in found or any(pattern.search(subject) for pattern in regexes[category])
+    
+    def _analyze_period_evidence(self, text: str, text_lower: str, lower_bytes: bytes | None = None) -> PeriodEvidence:
         """Check for presence of period/date evidence with improved detection"""
-        text_lower = text.lower()
-        
+        if lower_bytes is None:
+            lower_bytes = _encode(text_lower)
         periods = PeriodEvidence()
         
-        # More specific and discriminating period patterns
-        fy_patterns = [r"fy\s*(?:20\d{2}|1\d{3})", r"financial year.*(?:20\d{2}|1\d{3})", r"year.*end.*(?:20\d{2}|1\d{3})"]
-        quarterly_patterns = [r"q[1-4].*(?:20\d{2}|fy)", r"quarter.*(?:end|20\d{2})", r"half.*year.*(?:20\d{2})"]
-        year_patterns = [r"\b20[1-2]\d\b", r"\b1[89]\d{2}\b"]  # More specific year patterns
-        month_patterns = [r"march.*20\d{2}", r"mar.*20\d{2}", r"31.*march", r"31-mar"]
-        
         # Check for FY ending with actual years
-        for pattern in fy_patterns:
-            if re.search(pattern, text_lower):
+        for pattern in _FY_RES:
+            if pattern.search(lower_bytes):
                 periods.fy_ending_present = True
                 break
         
         # Check for quarterly patterns
-        for pattern in quarterly_patterns:
-            if re.search(pattern, text_lower):
+        for pattern in _QUARTERLY_RES:
+            if pattern.search(lower_bytes):
                 periods.quarterly_dates_present = True
                 break
         
         # Look for actual year references in data context
-        year_matches = []
-        for pattern in year_patterns:
-            matches = re.findall(pattern, text)
-            year_matches.extend(matches)
-        
-        # Only set if we have multiple years (indicating time series)
-        unique_years = set(year_matches)
+        # Only set if we have multiple years (indicating time series); two distinct years settle it
+        unique_years = set()
+        for match in _iter_matches(_YEAR_RES, text):
+            unique_years.add(match.group())
+            if len(unique_years) >= 2:
+                break
         periods.year_references_present = len(unique_years) >= 2
         
         # Check for month patterns with years
-        for pattern in month_patterns:
-            if re.search(pattern, text_lower):
+        for pattern in _MONTH_RES:
+            if pattern.search(lower_bytes):
                 periods.monthly_periods_present = True
                 break
         
@@ -232,32 +546,35 @@ class FinancialCompletenessAnalyzer:
         """Analyze numeric content richness with improved discrimination"""
         evidence = NumericEvidence()
         
-        # More sophisticated numeric analysis
-        currency_matches = []
-        for pattern in self.numeric_patterns[:3]:  # Currency patterns
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            currency_matches.extend(matches)
+        # More sophisticated numeric analysis; the counts below only need to reach their
+        # thresholds, so each scan stops as soon as the outcome is decided
+        currency_count = 0
+        currency_non_zero = False
+        for match in _iter_matches(_CURRENCY_RES, text):  # Currency patterns
+            currency_count += 1
+            currency_non_zero = currency_non_zero or not _ZERO_CURRENCY_RE.match(match.group())
+            if currency_count >= 3 and currency_non_zero:
+                break
         
-        percentage_matches = re.findall(r"\d+\.?\d*%", text)
-        large_number_matches = re.findall(r"\b\d{1,3}(?:,\d{3})+(?:\.\d{2})?\b", text)
+        # The re2 patterns (percentages, data rows) run on the UTF-8 encoding
+        subject = text if re2 is None else _encode(text)
+        percentage_count = _count_matches((_PERCENTAGE_RE,), subject, 2)
         
-        # Count actual numeric values (not just zeros or empty cells)
-        meaningful_numbers = re.findall(r"\b(?!0+\.?0*\b)\d{1,}(?:[,\.]\d+)*\b", text)
-        non_zero_numbers = [n for n in meaningful_numbers if not re.match(r"^0+\.?0*$", n)]
+        # Count actual numeric values (not just zeros or empty cells); the pattern's
+        # lookahead already rejects all-zero values, so every match is non-zero
+        non_zero_count = _count_matches((_MEANINGFUL_NUMBER_RE,), text, 15)
         
         # Count rows with actual data (not just headers or empty rows)
-        lines = text.split('\n')
-        data_rows = [line for line in lines if re.search(r'\d{3,}', line)]  # Lines with substantial numbers
+        data_row_count = _count_matches((_DATA_ROW_RE,), subject, 5)  # Lines with substantial numbers
         
         # More discriminating thresholds based on actual content
-        evidence.currency_amounts_present = len(currency_matches) >= 3 and len([m for m in currency_matches if not re.match(r'.*0+\.?0*.*', m)]) >= 1
-        evidence.percentages_present = len(percentage_matches) >= 2
-        evidence.substantial_numbers_present = len(non_zero_numbers) >= 15 and len(data_rows) >= 5
+        evidence.currency_amounts_present = currency_count >= 3 and currency_non_zero
+        evidence.percentages_present = percentage_count >= 2
+        evidence.substantial_numbers_present = non_zero_count >= 15 and data_row_count >= 5
         
         # Enhanced ratio detection
-        ratio_patterns = [r"\b\d+\.\d{2,}\b", r"\b\d+:\d+\b"]  # More specific ratios
-        ratio_count = sum(len(re.findall(pattern, text, re.IGNORECASE)) for pattern in ratio_patterns)
-        evidence.ratios_present = ratio_count >= 3 and len(non_zero_numbers) >= 10
+        ratio_count = _count_matches(_RATIO_RES, text, 3)
+        evidence.ratios_present = ratio_count >= 3 and non_zero_count >= 10
         
         return evidence
     
@@ -265,62 +582,50 @@ class FinancialCompletenessAnalyzer:
                          periods: PeriodEvidence, numeric: NumericEvidence) -> Tuple[FinancialCompletenessScores, FinancialCompletenessFlags]:
         """Calculate scores and flags based on analysis results"""
         
-        # Financial Statements Score (0-30 points)
-        statements_score = 0
-        if statements.profit_and_loss_present:
-            statements_score += 12
-        if statements.balance_sheet_present:
-            statements_score += 10
-        if statements.cash_flow_present:
-            statements_score += 8
+        # Financial Statements Score (0-30 points); the presence flags are bools, so each
+        # score is a weighted sum rather than a chain of ifs
+        statements_score = (
+            12 * statements.profit_and_loss_present
+            + 10 * statements.balance_sheet_present
+            + 8 * statements.cash_flow_present
+        )
         
         # Performance Metrics Score (0-25 points) - need at least 2 metrics
         performance_count = performance.performance_items_count
-        if performance_count >= 3:
-            performance_score = 25
-        elif performance_count == 2:
-            performance_score = 20
-        elif performance_count == 1:
-            performance_score = 10
-        else:
-            performance_score = 0
+        performance_score = _PERFORMANCE_POINTS[performance_count]
         
         # Period Evidence Score (0-25 points) with more discriminating scoring
-        period_score = 0
-        if periods.fy_ending_present:
-            period_score += 12  # Higher weight for specific FY dates
-        if periods.year_references_present:
-            period_score += 8   # Multiple years indicate time series
-        if periods.quarterly_dates_present:
-            period_score += 4
-        if periods.monthly_periods_present:
-            period_score += 3
-        period_score = min(period_score, 25)
+        period_score = min(
+            12 * periods.fy_ending_present         # Higher weight for specific FY dates
+            + 8 * periods.year_references_present  # Multiple years indicate time series
+            + 4 * periods.quarterly_dates_present
+            + 3 * periods.monthly_periods_present,
+            _MAX_PERIOD_SCORE,
+        )
         
         # Numeric Content Score (0-20 points) - enhanced scoring
         numeric_score = numeric.numeric_content_score
+        substantial = numeric.substantial_numbers_present
+        minimal_numeric = not substantial and not numeric.currency_amounts_present
         
         # Apply data quality penalty for template-like content
         data_quality_penalty = 0
-        if not numeric.substantial_numbers_present and not numeric.currency_amounts_present:
+        if minimal_numeric:
             data_quality_penalty = 10  # Heavy penalty for no meaningful numbers
-        elif not numeric.substantial_numbers_present:
+        elif not substantial:
             data_quality_penalty = 5   # Moderate penalty for limited numbers
         
         # Calculate total score with penalty
         total_score = statements_score + performance_score + period_score + numeric_score - data_quality_penalty
         total_score = max(0, total_score)  # Don't go below 0
         
-        # Create flags with enhanced detection
+        # Create flags with enhanced detection; every weight above is positive, so a zero
+        # score means none of its items were found
         flags = FinancialCompletenessFlags(
-            no_financial_statements=not any([
-                statements.profit_and_loss_present,
-                statements.balance_sheet_present,
-                statements.cash_flow_present,
-            ]),
+            no_financial_statements=statements_score == 0,
             insufficient_performance_metrics=performance_count < 2,
-            missing_period_evidence=not periods.has_period_evidence,
-            minimal_numeric_content=not numeric.substantial_numbers_present and not numeric.currency_amounts_present,
+            missing_period_evidence=period_score == 0,
+            minimal_numeric_content=minimal_numeric,
             likely_cover_page_only=statements_score == 0 and performance_score == 0,
             likely_notes_only=statements_score > 0 and numeric_score < 5
         )
@@ -341,7 +646,7 @@ class FinancialCompletenessAnalyzer:
         # Additional penalty for template-like content
         if flags.minimal_numeric_content and period_score < 10:
             classification = "accept_with_warnings"  # Demote if no real data
-            if total_score < 40:
+            if total_score < _REJECT_BELOW:
                 classification = "reject_incomplete"
         
         # Create scores object
@@ -355,3 +660,22 @@ class FinancialCompletenessAnalyzer:
         )
         
         return scores, flags
+
+# Shared instance; the analyzer keeps no per-document state, so one serves every caller
+ANALYZER = FinancialCompletenessAnalyzer()
+
+def analyze_document(filename: str, text: str, early_exit: bool = False) -> FinancialCompletenessAnalysis:
+    """Analyze one document with the shared analyzer."""
+    return ANALYZER.analyze_document(filename, text, early_exit)
+
+def analyze_many(docs: List[Tuple[str, str]], max_workers: int | None = None) -> List[FinancialCompletenessAnalysis]:
+    """
+    Analyze many (filename, text) documents with the shared analyzer, in order.
+    Documents are spread over a thread pool (one worker per CPU by default); with a single
+    worker or document they run inline.
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(docs))
+    if workers <= 1:
+        return [ANALYZER.analyze_document(filename, text) for filename, text in docs]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="financial-analyzer") as pool:
+        return list(pool.map(ANALYZER.analyze_document, *zip(*docs)))
@@ -26,13 +26,13 @@ class PerformanceMetrics(BaseModel):
     @property
     def performance_items_count(self) -> int:
         """Count of performance metrics found"""
-        return sum([
-            self.sales_revenue_present,
-            self.expenses_present,
-            self.net_profit_present,
-            self.eps_present,
-            self.ebitda_present,
-        ])
+        return (
+            int(self.sales_revenue_present)
+            + int(self.expenses_present)
+            + int(self.net_profit_present)
+            + int(self.eps_present)
+            + int(self.ebitda_present)
+        )
 
 class PeriodEvidence(BaseModel):
     fy_ending_present: bool = False
@@ -43,12 +43,12 @@ class PeriodEvidence(BaseModel):
     @property
     def has_period_evidence(self) -> bool:
         """Check if any period evidence is present"""
-        return any([
-            self.fy_ending_present,
-            self.quarterly_dates_present,
-            self.monthly_periods_present,
-            self.year_references_present,
-        ])
+        return (
+            self.fy_ending_present
+            or self.quarterly_dates_present
+            or self.monthly_periods_present
+            or self.year_references_present
+        )
 
 class NumericEvidence(BaseModel):
     substantial_numbers_present: bool = False
@@ -59,16 +59,13 @@ class NumericEvidence(BaseModel):
     @property
     def numeric_content_score(self) -> int:
         """Score numeric content richness (0-20 points)"""
-        score = 0
-        if self.substantial_numbers_present:
-            score += 8
-        if self.currency_amounts_present:
-            score += 5
-        if self.percentages_present:
-            score += 4
-        if self.ratios_present:
-            score += 3
-        return min(score, 20)
+        # The weights add up to exactly 20, so no cap is needed
+        return (
+            8 * self.substantial_numbers_present
+            + 5 * self.currency_amounts_present
+            + 4 * self.percentages_present
+            + 3 * self.ratios_present
+        )
 
 class FinancialCompletenessScores(BaseModel):
     financial_statements_score: int = Field(default=0, ge=0, le=30, description="Score for having core financial statements")
@@ -1,11 +1,32 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Any, Type
+
+from pydantic import BaseModel
+
 from src.core.settings import get_settings
 
+@lru_cache(maxsize=1)
 def get_llm_id() -> str:
     """
     CrewAI supports setting llm as a STRING identifier (recommended when LLM class isn't available).
     Example: "ollama/qwen2.5:7b"
+    Built once per process, like the settings it comes from.
     """
     s = get_settings()
     return f"ollama/{s.chat_model}"
+
+def get_llm(response_format: Type[BaseModel] | None = None) -> Any:
+    """
+    Returns an LLM for a CrewAI Agent.
+    With structured output enabled, the provider is asked to constrain decoding to the
+    JSON schema of `response_format`; otherwise the plain string identifier is returned.
+    """
+    s = get_settings()
+    if response_format is None or not s.structured_output:
+        return get_llm_id()
+
+    from crewai import LLM  # type: ignore
+
+    return LLM(model=get_llm_id(), base_url=s.ollama_base_url, response_format=response_format)
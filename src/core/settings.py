@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -14,13 +15,26 @@ class Settings:
     sqlite_path: Path
     embed_model: str
     chat_model: str
+    structured_output: bool = True
+    crew_concurrency: int = 4
+    chunk_tokenizer: str = ""
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    """
+    Read the environment once per process; the frozen Settings instance is shared by every
+    caller. Call get_settings.cache_clear() to pick up changed environment variables.
+    """
     ollama_base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
     qdrant_path_str = os.getenv("QDRANT_PATH", "./storage/qdrant")
     sqlite_path_str = os.getenv("SQLITE_PATH", "./storage/sqlite/app.db")
     embed_model = os.getenv("EMBED_MODEL", "nomic-embed-text")
     chat_model = os.getenv("CHAT_MODEL", "qwen2.5:7b")
+    # Set to 0 for providers without constrained (JSON-schema) decoding
+    structured_output = os.getenv("LLM_STRUCTURED_OUTPUT", "1").strip().lower() not in ("0", "false", "no")
+    crew_concurrency = max(1, int(os.getenv("CREW_CONCURRENCY", "4")))
+    # tokenizer.json path or Hugging Face id to size RAG chunks in tokens; unset = characters
+    chunk_tokenizer = os.getenv("CHUNK_TOKENIZER", "").strip()
 
     qdrant_path = Path(qdrant_path_str).expanduser().resolve()
     sqlite_path = Path(sqlite_path_str).expanduser().resolve()
@@ -34,4 +48,7 @@ def get_settings() -> Settings:
         sqlite_path=sqlite_path,
         embed_model=embed_model,
         chat_model=chat_model,
-    )
\ No newline at end of file
+        structured_output=structured_output,
+        crew_concurrency=crew_concurrency,
+        chunk_tokenizer=chunk_tokenizer,
+    )
@@ -0,0 +1,31 @@
+"""JSON encoding for the stores: orjson when installed, the stdlib otherwise."""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson  # optional: C/Rust encoder, several times faster than json
+except ImportError:
+    orjson = None
+
+def dumps(obj: Any) -> bytes:
+    """Compact UTF-8 JSON."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits or lone surrogates; the stdlib encoder handles those
+    try:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    except UnicodeEncodeError:
+        # Lone surrogates (PDF-extracted text has them) have no UTF-8 form; escape them as \udXXX
+        return json.dumps(obj).encode("ascii")
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. escaped lone surrogates, which only the stdlib decoder accepts
+    return json.loads(data)
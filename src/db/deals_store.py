@@ -1,22 +1,42 @@
 from __future__ import annotations
 
-import json
+import sqlite3
 from pathlib import Path
 from typing import List, Dict, Any, Union
 
+from src.db.codec import dumps, loads
+from src.db.sqlite import transaction
+
+# Deals live in the app database, one row per deal; rowid keeps the insertion order.
+# DEALS_PATH is the JSON file they used to be rewritten to, imported once into a new table.
 DEALS_PATH = Path("storage") / "sqlite" / "deals.json"
-DEALS_PATH.parent.mkdir(parents=True, exist_ok=True)
+_SCHEMA = ("CREATE TABLE deals (deal_id TEXT PRIMARY KEY, data TEXT NOT NULL)",)
 
-def load_deals() -> List[Dict[str, Any]]:
-    if not DEALS_PATH.exists():
-        return []
+def _migrate(conn: sqlite3.Connection) -> None:
+    # A missing or unreadable legacy file just means there is nothing to import
     try:
-        return json.loads(DEALS_PATH.read_text(encoding="utf-8"))
+        deals = loads(DEALS_PATH.read_bytes())
     except Exception:
-        return []
+        return
+    # The old file was never checked for repeated deal_ids; keep the last copy of each
+    _insert(conn, deals, "INSERT OR REPLACE")
+
+def _insert(conn: sqlite3.Connection, deals: List[Dict[str, Any]], verb: str = "INSERT") -> None:
+    conn.executemany(
+        f"{verb} INTO deals (deal_id, data) VALUES (?, ?)",
+        ((d.get("deal_id"), dumps(d).decode()) for d in deals),
+    )
+
+def load_deals() -> List[Dict[str, Any]]:
+    with transaction("deals", _SCHEMA, _migrate) as conn:
+        rows = conn.execute("SELECT data FROM deals ORDER BY rowid").fetchall()
+    return [loads(data) for data, in rows]
 
 def save_deals(deals: List[Dict[str, Any]]) -> None:
-    DEALS_PATH.write_text(json.dumps(deals, indent=2), encoding="utf-8")
+    # Plain INSERT: a repeated deal_id raises IntegrityError and rolls back instead of being dropped
+    with transaction("deals", _SCHEMA, _migrate) as conn:
+        conn.execute("DELETE FROM deals")
+        _insert(conn, deals)
 
 def upsert_deal(*args, **kwargs) -> None:
     """
@@ -37,17 +57,14 @@ def upsert_deal(*args, **kwargs) -> None:
     if not did:
         raise ValueError("deal_id is required")
 
-    deals = load_deals()
-    updated = False
-    for i, d in enumerate(deals):
-        if d.get("deal_id") == did:
-            deals[i] = {**d, **deal}
-            updated = True
-            break
-    if not updated:
-        deals.append(deal)
-
-    save_deals(deals)
+    # Primary-key lookup; an existing row is updated in place so the deal keeps its position
+    with transaction("deals", _SCHEMA, _migrate) as conn:
+        row = conn.execute("SELECT data FROM deals WHERE deal_id = ?", (did,)).fetchone()
+        if row is None:
+            conn.execute("INSERT INTO deals (deal_id, data) VALUES (?, ?)", (did, dumps(deal).decode()))
+        else:
+            merged = {**loads(row[0]), **deal}
+            conn.execute("UPDATE deals SET data = ? WHERE deal_id = ?", (dumps(merged).decode(), did))
 
 # Aliases used in other pages
 def save_deal(deal: Dict[str, Any]) -> None:
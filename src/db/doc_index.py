@@ -1,33 +1,48 @@
 from __future__ import annotations
-import json
+import sqlite3
 from pathlib import Path
 from typing import Dict, Any, List
 
+from src.db.codec import dumps, loads
+from src.db.sqlite import transaction
+
+# Routed documents live in the app database, keyed by (deal_id, doc_id, filename).
+# RESULTS_DIR/<deal_id>/doc_index.json is where they used to be rewritten to; those files
+# are imported once into a new table.
 RESULTS_DIR = Path("storage") / "results"
+_SCHEMA = (
+    "CREATE TABLE docs (deal_id TEXT NOT NULL, doc_id TEXT, filename TEXT, data TEXT NOT NULL)",
+    "CREATE INDEX docs_key ON docs (deal_id, doc_id, filename)",
+)
 
-def _path(deal_id: str) -> Path:
-    d = RESULTS_DIR / deal_id
-    d.mkdir(parents=True, exist_ok=True)
-    return d / "doc_index.json"
+def _migrate(conn: sqlite3.Connection) -> None:
+    for p in sorted(RESULTS_DIR.glob("*/doc_index.json")):
+        try:
+            arr = loads(p.read_bytes())
+        except Exception:
+            continue
+        conn.executemany(
+            "INSERT INTO docs (deal_id, doc_id, filename, data) VALUES (?, ?, ?, ?)",
+            ((p.parent.name, d.get("doc_id"), d.get("filename"), dumps(d).decode()) for d in arr),
+        )
 
 def load_doc_index(deal_id: str) -> List[Dict[str, Any]]:
-    p = _path(deal_id)
-    if not p.exists():
-        return []
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        with transaction("docs", _SCHEMA, _migrate) as conn:
+            rows = conn.execute("SELECT data FROM docs WHERE deal_id = ? ORDER BY rowid", (deal_id,)).fetchall()
     except Exception:
         return []
+    return [loads(data) for data, in rows]
 
 def upsert_doc(deal_id: str, doc: Dict[str, Any]) -> None:
-    arr = load_doc_index(deal_id)
-    key = (doc.get("doc_id"), doc.get("filename"))
-    updated = False
-    for i, d in enumerate(arr):
-        if (d.get("doc_id"), d.get("filename")) == key:
-            arr[i] = {**d, **doc}
-            updated = True
-            break
-    if not updated:
-        arr.append(doc)
-    _path(deal_id).write_text(json.dumps(arr, indent=2), encoding="utf-8")
+    # IS rather than = so a missing doc_id/filename still matches its earlier entry
+    key = (deal_id, doc.get("doc_id"), doc.get("filename"))
+    with transaction("docs", _SCHEMA, _migrate) as conn:
+        row = conn.execute(
+            "SELECT rowid, data FROM docs WHERE deal_id = ? AND doc_id IS ? AND filename IS ? ORDER BY rowid LIMIT 1",
+            key,
+        ).fetchone()
+        if row is None:
+            conn.execute("INSERT INTO docs (deal_id, doc_id, filename, data) VALUES (?, ?, ?, ?)", (*key, dumps(doc).decode()))
+        else:
+            conn.execute("UPDATE docs SET data = ? WHERE rowid = ?", (dumps({**loads(row[1]), **doc}).decode(), row[0]))
@@ -1,8 +1,9 @@
 from __future__ import annotations
-import json
 from pathlib import Path
 from typing import Any, Dict, List
 
+from src.db.codec import dumps, loads
+
 RESULTS_DIR = Path("storage") / "results"
 
 def _deal_dir(deal_id: str) -> Path:
@@ -14,19 +15,43 @@ def _read_json(path: Path, default):
     if not path.exists():
         return default
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return loads(path.read_bytes())
     except Exception:
         return default
 
-def _write_json(path: Path, data) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+# Results are appended one JSON object per line (<kind>_results.ndjson), so adding one
+# never rewrites the ones before it. <kind>_results.json is the array format they used to
+# be kept in; it is still read, and converted on the next append.
+def _read_results(deal_id: str, kind: str) -> List[Dict[str, Any]]:
+    d = _deal_dir(deal_id)
+    path = d / f"{kind}_results.ndjson"
+    if not path.exists():
+        return _read_json(d / f"{kind}_results.json", [])
+    rows: List[Dict[str, Any]] = []
+    with path.open("rb") as f:
+        for line in f:
+            if line.strip():
+                try:
+                    rows.append(loads(line))
+                except ValueError:
+                    continue  # torn write
+    return rows
+
+def _append_result(deal_id: str, kind: str, result: Dict[str, Any]) -> None:
+    d = _deal_dir(deal_id)
+    path = d / f"{kind}_results.ndjson"
+    if path.exists():
+        lines = [result]
+    else:
+        lines = _read_json(d / f"{kind}_results.json", []) + [result]
+    with path.open("ab") as f:
+        f.write(b"".join(dumps(r) + b"\n" for r in lines))
 
 def load_legal_results(deal_id: str) -> List[Dict[str, Any]]:
-    return _read_json(_deal_dir(deal_id) / "legal_results.json", [])
+    return _read_results(deal_id, "legal")
 
 def load_financial_results(deal_id: str) -> List[Dict[str, Any]]:
-    return _read_json(_deal_dir(deal_id) / "financial_results.json", [])
+    return _read_results(deal_id, "financial")
 
 def already_processed(deal_id: str, filename: str) -> bool:
     fn = filename.strip()
@@ -39,13 +64,7 @@ def already_processed(deal_id: str, filename: str) -> bool:
     return False
 
 def append_legal_result(deal_id: str, result: Dict[str, Any]) -> None:
-    path = _deal_dir(deal_id) / "legal_results.json"
-    arr: List[Dict[str, Any]] = _read_json(path, [])
-    arr.append(result)
-    _write_json(path, arr)
+    _append_result(deal_id, "legal", result)
 
 def append_financial_result(deal_id: str, result: Dict[str, Any]) -> None:
-    path = _deal_dir(deal_id) / "financial_results.json"
-    arr: List[Dict[str, Any]] = _read_json(path, [])
-    arr.append(result)
-    _write_json(path, arr)
+    _append_result(deal_id, "financial", result)
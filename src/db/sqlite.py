@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import sqlite3
+from contextlib import contextmanager
+from typing import Callable, Iterator, Sequence
+
+from src.core.settings import get_settings
+
+@contextmanager
+def transaction(table: str, schema: Sequence[str],
+                migrate: Callable[[sqlite3.Connection], None] | None = None) -> Iterator[sqlite3.Connection]:
+    """
+    Open the app database and run the body in one transaction, creating `table` (with the
+    `schema` statements) first if needed. A freshly created table is seeded by `migrate`,
+    e.g. from the JSON files it replaces, in the same transaction.
+    """
+    conn = sqlite3.connect(get_settings().sqlite_path, timeout=30, isolation_level=None)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+            ).fetchone()
+            if not exists:
+                for statement in schema:
+                    conn.execute(statement)
+                if migrate is not None:
+                    migrate(conn)
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
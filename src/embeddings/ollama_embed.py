@@ -1,8 +1,22 @@
 from __future__ import annotations
 
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import List
 
+# One keep-alive connection pool for every embedding call, instead of a new socket per text
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+
+# Texts per /api/embed request; keeps each request well inside the timeout
+EMBED_BATCH_SIZE = 64
+
+# Concurrent /api/embeddings requests when batching is unavailable; kept below the pool size
+# and low enough not to swamp Ollama, which runs only a few embedding requests at once
+EMBED_WORKERS = 8
+
 def embed_text(base_url: str, model: str, text: str, timeout_s: float = 60.0) -> List[float]:
     """
     Calls Ollama embeddings API:
@@ -10,10 +24,39 @@ def embed_text(base_url: str, model: str, text: str, timeout_s: float = 60.0) ->
     Returns a vector list[float].
     """
     payload = {"model": model, "prompt": text}
-    r = requests.post(f"{base_url}/api/embeddings", json=payload, timeout=timeout_s)
+    r = SESSION.post(f"{base_url}/api/embeddings", json=payload, timeout=timeout_s)
     r.raise_for_status()
     data = r.json()
     vec = data.get("embedding")
     if not isinstance(vec, list) or not vec:
         raise RuntimeError(f"No embedding returned from Ollama. Response: {str(data)[:200]}")
     return vec
+
+def _embed_each(base_url: str, model: str, texts: List[str], timeout_s: float) -> List[List[float]]:
+    """One /api/embeddings request per text, overlapped on a small thread pool; keeps order."""
+    if len(texts) <= 1:
+        return [embed_text(base_url, model, t, timeout_s) for t in texts]
+    with ThreadPoolExecutor(max_workers=min(EMBED_WORKERS, len(texts)), thread_name_prefix="embed") as pool:
+        return list(pool.map(lambda t: embed_text(base_url, model, t, timeout_s), texts))
+
+def embed_texts(base_url: str, model: str, texts: List[str], timeout_s: float = 60.0,
+                batch_size: int = EMBED_BATCH_SIZE) -> List[List[float]]:
+    """
+    Embeds many texts with the batch API:
+      POST /api/embed  { "model": "...", "input": ["...", ...] }
+    Returns one vector per text, in order. Servers without /api/embed (or answering it
+    without a usable "embeddings" list) get one embed_text call per text instead, a few
+    at a time.
+    """
+    vectors: List[List[float]] = []
+    for start in range(0, len(texts), batch_size):
+        batch = texts[start:start + batch_size]
+        r = SESSION.post(f"{base_url}/api/embed", json={"model": model, "input": batch}, timeout=timeout_s)
+        if r.status_code == 404:
+            return vectors + _embed_each(base_url, model, texts[start:], timeout_s)
+        r.raise_for_status()
+        embs = r.json().get("embeddings")
+        if not isinstance(embs, list) or len(embs) != len(batch) or not all(embs):
+            return vectors + _embed_each(base_url, model, texts[start:], timeout_s)
+        vectors.extend(embs)
+    return vectors
@@ -1,5 +1,6 @@
 from __future__ import annotations
-import requests
+
+from src.embeddings.ollama_embed import SESSION
 
 def embed_text_ollama(base_url: str, model: str, text: str, timeout_s: float = 60.0) -> list[float]:
     """
@@ -9,7 +10,7 @@ def embed_text_ollama(base_url: str, model: str, text: str, timeout_s: float = 6
     Returns a single embedding vector for `text`.
     """
     payload_embed = {"model": model, "input": text}
-    r = requests.post(f"{base_url}/api/embed", json=payload_embed, timeout=timeout_s)
+    r = SESSION.post(f"{base_url}/api/embed", json=payload_embed, timeout=timeout_s)
     if r.status_code == 200:
         data = r.json()
         # /api/embed returns: {"embeddings":[[...]]} for single input or list
@@ -20,7 +21,7 @@ def embed_text_ollama(base_url: str, model: str, text: str, timeout_s: float = 6
 
     # fallback older endpoint
     payload_old = {"model": model, "prompt": text}
-    r2 = requests.post(f"{base_url}/api/embeddings", json=payload_old, timeout=timeout_s)
+    r2 = SESSION.post(f"{base_url}/api/embeddings", json=payload_old, timeout=timeout_s)
     if r2.status_code != 200:
         raise RuntimeError(f"Ollama embedding failed: /api/embed HTTP {r.status_code} and /api/embeddings HTTP {r2.status_code}: {r2.text[:200]}")
     data2 = r2.json()
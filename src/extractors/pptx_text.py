@@ -1,16 +1,25 @@
 from __future__ import annotations
+from typing import Iterator
+
 from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+def _shape_texts(shapes) -> Iterator[str]:
+    """Non-empty text of each shape, descending into grouped shapes."""
+    for shape in shapes:
+        if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+            yield from _shape_texts(shape.shapes)
+            continue
+        # .text walks the shape's XML runs on every access, so read it once
+        t = getattr(shape, "text", None)
+        if t and (t := t.strip()):
+            yield t
 
 def extract_pptx_text(path: str) -> str:
     prs = Presentation(path)
     parts = []
     for i, slide in enumerate(prs.slides, start=1):
-        slide_text = []
-        for shape in slide.shapes:
-            if hasattr(shape, "text"):
-                t = (shape.text or "").strip()
-                if t:
-                    slide_text.append(t)
+        slide_text = list(_shape_texts(slide.shapes))
         if slide_text:
             parts.append(f"Slide {i}:\n" + "\n".join(slide_text))
     return "\n\n".join(parts)
@@ -1,14 +1,94 @@
 from __future__ import annotations
+import re
+from itertools import islice
+
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv  # optional (Streamlit depends on it): C++ CSV reader
+except ImportError:
+    pa = pacsv = None
+
+try:
+    import python_calamine  # optional: Rust XLSX reader, about 3x faster than openpyxl here
+except ImportError:
+    python_calamine = None
+
+# pandas reads workbooks with calamine when it is installed (same rendered output)
+EXCEL_ENGINE = "calamine" if python_calamine is not None else None
+
+# 19+ digit numbers may not fit int64, which pandas and PyArrow type differently
+_LONG_DIGITS = re.compile(rb"\d{19}")
+# pandas' default NA markers, so both readers render the same cells as empty
+CSV_NULL_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+# Only the first max_rows rows are ever rendered, so only those are parsed: read_csv stops
+# after nrows, and the Excel readers (openpyxl in read-only mode, calamine) stop there too.
+
+def _arrow_csv_head(path: str, max_rows: int) -> pd.DataFrame | None:
+    """
+    The first max_rows rows parsed with PyArrow, or None where the result could differ from
+    pandas. Only the header and max_rows lines are handed to PyArrow, so like read_csv(nrows=)
+    it infers column types from those rows alone. Columns it types as dates/times (pandas
+    keeps their text) are re-read as strings; non-UTF-8 text, unnamed or duplicate headers,
+    rows spanning lines and integers past int64 go to pandas.
+    """
+    with open(path, "rb") as f:
+        head = b"".join(islice(f, max_rows + 1))
+        at_eof = not f.read(1)
+    if _LONG_DIGITS.search(head):
+        return None
+    column_types = {}
+    while True:
+        options = pacsv.ConvertOptions(
+            column_types=column_types,
+            null_values=CSV_NULL_VALUES,
+            true_values=["True", "TRUE", "true"],
+            false_values=["False", "FALSE", "false"],
+            strings_can_be_null=True,
+        )
+        table = pacsv.read_csv(pa.py_buffer(head), convert_options=options)
+        temporal = {f.name: pa.string() for f in table.schema if pa.types.is_temporal(f.type)}
+        if not temporal:
+            break
+        column_types.update(temporal)
+    names = table.schema.names
+    if (
+        (table.num_rows < max_rows and not at_eof)
+        or any(pa.types.is_binary(f.type) for f in table.schema)
+        or "" in names or len(set(names)) < len(names)
+    ):
+        return None
+    return table.to_pandas()
+
+def _read_csv_head(path: str, max_rows: int) -> pd.DataFrame:
+    """The first max_rows rows, parsed by PyArrow when it can stand in for pandas."""
+    if pacsv is not None:
+        try:
+            df = _arrow_csv_head(path, max_rows)
+            if df is not None:
+                return df
+        except pa.ArrowException:
+            pass  # ragged rows, a quoted field cut off at the last line...: pandas copes
+    return pd.read_csv(path, nrows=max_rows)
+
 def extract_csv_text(path: str, max_rows: int = 200) -> str:
-    df = pd.read_csv(path)
-    return df.head(max_rows).to_csv(index=False)
+    df = _read_csv_head(path, max_rows)
+    return df.to_csv(index=False)
 
 def extract_xlsx_text(path: str, max_rows: int = 200) -> str:
-    xls = pd.ExcelFile(path)
+    try:
+        xls = pd.ExcelFile(path, engine=EXCEL_ENGINE)
+    except Exception:
+        if EXCEL_ENGINE is None:
+            raise
+        xls = pd.ExcelFile(path)  # let openpyxl have a go at files calamine rejects
     parts = []
     for sheet in xls.sheet_names[:5]:
-        df = xls.parse(sheet).head(max_rows)
+        df = xls.parse(sheet, nrows=max_rows)
         parts.append(f"Sheet: {sheet}\n{df.to_csv(index=False)}")
     return "\n\n".join(parts)
@@ -1,5 +1,15 @@
 from __future__ import annotations
 
+import os
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from tokenizers import Tokenizer  # optional: Rust tokenizer for token-sized chunks
+except ImportError:
+    Tokenizer = None
+
 def chunk_text(text: str, chunk_size: int = 1200, overlap: int = 150) -> list[str]:
     """
     Simple character-based chunking with overlap.
@@ -19,4 +29,41 @@ def chunk_text(text: str, chunk_size: int = 1200, overlap: int = 150) -> list[st
         if end == n:
             break
         start = max(0, end - overlap)
-    return chunks
\ No newline at end of file
+    return chunks
+
+@lru_cache(maxsize=4)
+def load_tokenizer(name: str) -> "Tokenizer | None":
+    """
+    Tokenizer from a tokenizer.json path or a Hugging Face model id (e.g. "bert-base-uncased",
+    the vocabulary nomic-embed-text uses). None when unset, not installed or not loadable.
+    """
+    if Tokenizer is None or not name:
+        return None
+    try:
+        tokenizer = Tokenizer.from_file(name) if os.path.isfile(name) else Tokenizer.from_pretrained(name)
+    except Exception:
+        return None
+    tokenizer.no_truncation()
+    tokenizer.no_padding()
+    return tokenizer
+
+def chunk_tokens(text: str, tokenizer: "Tokenizer", size: int = 256, overlap: int = 40) -> list[str]:
+    """
+    Windows of exactly `size` tokens (the last may be shorter) overlapping by `overlap`,
+    cut at token boundaries so no chunk exceeds the embedder's budget. All window bounds come
+    from one vectorized pass over the token character offsets.
+    """
+    text = text.strip()
+    if not text:
+        return []
+    offsets = np.asarray(tokenizer.encode(text, add_special_tokens=False).offsets, dtype=np.int64).reshape(-1, 2)
+    n = len(offsets)
+    if n == 0:
+        return []
+    step = max(1, size - overlap)
+    # Same stopping rule as chunk_text: the first window that reaches the end is the last
+    count = 1 + max(0, -(-(n - size) // step))
+    starts = np.arange(count) * step
+    ends = np.minimum(starts + size, n) - 1
+    bounds = zip(offsets[starts, 0].tolist(), offsets[ends, 1].tolist())
+    return [chunk for chunk in (text[a:b].strip() for a, b in bounds) if chunk]
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional
 import hashlib
+import sqlite3
+import warnings
+
+import numpy as np
 
 from qdrant_client import QdrantClient
 from qdrant_client.http import models as qm
 
-from src.embeddings.ollama_embed import embed_text
+from src.core.settings import get_settings
+from src.db.sqlite import transaction
+from src.embeddings.ollama_embed import embed_texts
 from src.extractors.pdf_text import extract_pdf_text
+from src.ingestion.chunking import chunk_text, chunk_tokens, load_tokenizer
 from src.extractors.docx_text import extract_docx_text
 from src.extractors.pptx_text import extract_pptx_text
 from src.extractors.tabular_text import extract_csv_text, extract_xlsx_text
@@ -17,6 +26,36 @@ from src.vectordb.qdrant_store import get_qdrant_local_client
 
 COLLECTION_NAME = "deal_chunks"
 
+# Chunk size when a tokenizer is configured (CHUNK_TOKENIZER); about the 900 characters used otherwise
+CHUNK_TOKENS = 256
+CHUNK_OVERLAP_TOKENS = 40
+CHUNK_CHARS = 900
+CHUNK_OVERLAP_CHARS = 150
+
+# Points are embedded and upserted this many chunks at a time
+UPSERT_BATCH_SIZE = 256
+
+# Manifest of ingested files: content hash and chunk count per (deal_id, doc_id), so an
+# unchanged or re-uploaded file reuses the points already in Qdrant instead of being
+# extracted and embedded again. Points depend on the embedding model and on how the text was
+# chunked (see _chunker_id), so both are part of the match.
+_MANIFEST_SCHEMA = (
+    """CREATE TABLE ingested_docs (
+        deal_id TEXT NOT NULL,
+        doc_id TEXT NOT NULL,
+        content_hash TEXT NOT NULL,
+        embed_model TEXT NOT NULL,
+        chunker TEXT NOT NULL,
+        chunks INTEGER NOT NULL,
+        PRIMARY KEY (deal_id, doc_id)
+    )""",
+    "CREATE INDEX ingested_docs_hash ON ingested_docs (content_hash, embed_model, chunker)",
+)
+
+# Embedding cache: float32 vector bytes per BLAKE2b-128 of (model, chunk text). Headers,
+# footers and disclaimers repeat across a data room, and their chunks are embedded once.
+_EMBED_CACHE_SCHEMA = ("CREATE TABLE embed_cache (key BLOB PRIMARY KEY, vector BLOB NOT NULL) WITHOUT ROWID",)
+
 @dataclass
 class IngestResult:
     filename: str
@@ -28,22 +67,108 @@ def _point_id(deal_id: str, doc_id: str, chunk_id: int) -> int:
     h = hashlib.blake2b(key, digest_size=8).digest()
     return int.from_bytes(h, "big", signed=False)
 
-def _chunk_text(text: str, chunk_size: int = 900, overlap: int = 150) -> List[str]:
-    text = (text or "").strip()
-    if not text:
-        return []
-    chunks = []
-    start = 0
-    n = len(text)
-    while start < n:
-        end = min(n, start + chunk_size)
-        chunk = text[start:end].strip()
-        if chunk:
-            chunks.append(chunk)
-        if end == n:
-            break
-        start = max(0, end - overlap)
-    return chunks
+def _point_ids(deal_id: str, doc_id: str, n: int) -> List[int]:
+    """_point_id for chunks 1..n: the shared "deal:doc:" prefix is hashed once and the hash state copied per chunk."""
+    prefix = hashlib.blake2b(f"{deal_id}:{doc_id}:".encode("utf-8"), digest_size=8)
+    ids = []
+    for chunk_id in range(1, n + 1):
+        h = prefix.copy()
+        h.update(b"%d" % chunk_id)
+        ids.append(int.from_bytes(h.digest(), "big", signed=False))
+    return ids
+
+def _file_hash(path: str) -> str:
+    """BLAKE2b-128 of the file contents, read in blocks."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+
+@contextmanager
+def _manifest() -> Iterator[sqlite3.Connection]:
+    with transaction("ingested_docs", _MANIFEST_SCHEMA) as conn:
+        # Manifests written before chunking was configurable lack the chunker column; their
+        # rows get an empty one, which matches no chunker, so those files are ingested afresh
+        if not any(col[1] == "chunker" for col in conn.execute("PRAGMA table_info(ingested_docs)")):
+            conn.execute("ALTER TABLE ingested_docs ADD COLUMN chunker TEXT NOT NULL DEFAULT ''")
+        yield conn
+
+def _ingested_copies(content_hash: str, embed_model: str, chunker: str, deal_id: str, doc_id: str) -> List[tuple]:
+    """(deal_id, doc_id, chunks) of earlier ingestions of the same content, this document's own first."""
+    with _manifest() as conn:
+        rows = conn.execute(
+            "SELECT deal_id, doc_id, chunks FROM ingested_docs WHERE content_hash = ? AND embed_model = ? AND chunker = ?",
+            (content_hash, embed_model, chunker),
+        ).fetchall()
+    return sorted(rows, key=lambda r: (r[0], r[1]) != (deal_id, doc_id))
+
+def _record_ingested(deal_id: str, doc_id: str, content_hash: str, embed_model: str, chunker: str, chunks: int) -> None:
+    with _manifest() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO ingested_docs (deal_id, doc_id, content_hash, embed_model, chunker, chunks) VALUES (?, ?, ?, ?, ?, ?)",
+            (deal_id, doc_id, content_hash, embed_model, chunker, chunks),
+        )
+
+def _embed_cached(base_url: str, model: str, texts: List[str]) -> List[List[float]]:
+    """embed_texts, embedding only the distinct texts not already in the embedding cache."""
+    prefix = model.encode("utf-8") + b"\0"
+    keys = [hashlib.blake2b(prefix + t.encode("utf-8"), digest_size=16).digest() for t in texts]
+    distinct = list(dict.fromkeys(keys))
+    with transaction("embed_cache", _EMBED_CACHE_SCHEMA) as conn:
+        found = dict(conn.execute(
+            f"SELECT key, vector FROM embed_cache WHERE key IN ({','.join('?' * len(distinct))})", distinct
+        ).fetchall())
+    vectors = {k: np.frombuffer(v, dtype=np.float32).tolist() for k, v in found.items()}
+
+    missing = [k for k in distinct if k not in vectors]
+    if missing:
+        text_of = dict(zip(keys, texts))
+        embedded = embed_texts(base_url, model, [text_of[k] for k in missing])
+        with transaction("embed_cache", _EMBED_CACHE_SCHEMA) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embed_cache (key, vector) VALUES (?, ?)",
+                ((k, np.asarray(v, dtype=np.float32).tobytes()) for k, v in zip(missing, embedded)),
+            )
+        vectors.update(zip(missing, embedded))
+    return [vectors[k] for k in keys]
+
+def _reuse_points(client: QdrantClient, source: tuple, deal_id: str, doc_id: str, filename: str) -> bool:
+    """
+    Make sure (deal_id, doc_id) has the points of an earlier ingestion `source` of the same
+    content, copying vectors and payloads when it is another document. False if they are gone.
+    """
+    src_deal, src_doc, n = source
+    if n == 0:
+        return True
+    if not client.collection_exists(COLLECTION_NAME):
+        return False
+    src_ids = _point_ids(src_deal, src_doc, n)
+    if (src_deal, src_doc) == (deal_id, doc_id):
+        return len(client.retrieve(COLLECTION_NAME, ids=src_ids, with_payload=False)) == n
+    records = {r.id: r for r in client.retrieve(COLLECTION_NAME, ids=src_ids, with_payload=True, with_vectors=True)}
+    if len(records) != n:
+        return False
+    points = qm.Batch(
+        ids=_point_ids(deal_id, doc_id, n),
+        vectors=[records[pid].vector for pid in src_ids],
+        payloads=[
+            {**(records[pid].payload or {}), "deal_id": deal_id, "doc_id": doc_id, "filename": filename}
+            for pid in src_ids
+        ],
+    )
+    client.upsert(collection_name=COLLECTION_NAME, points=points)
+    return True
+
+def _chunk_text(text: str, chunk_size: int = CHUNK_CHARS, overlap: int = CHUNK_OVERLAP_CHARS) -> List[str]:
+    tokenizer = load_tokenizer(get_settings().chunk_tokenizer)
+    if tokenizer is not None:
+        return chunk_tokens(text or "", tokenizer, CHUNK_TOKENS, CHUNK_OVERLAP_TOKENS)
+    return chunk_text(text or "", chunk_size, overlap)
+
+def _chunker_id() -> str:
+    """How _chunk_text splits text right now, e.g. "chars:900/150" or "tokens:bert-base-uncased:256/40"."""
+    name = get_settings().chunk_tokenizer
+    if load_tokenizer(name) is not None:
+        return f"tokens:{name}:{CHUNK_TOKENS}/{CHUNK_OVERLAP_TOKENS}"
+    return f"chars:{CHUNK_CHARS}/{CHUNK_OVERLAP_CHARS}"
 
 def _extract_text_for_file(path: str) -> str:
     p = Path(path)
@@ -64,10 +189,22 @@ def _ensure_collection(client: QdrantClient, vector_size: int) -> None:
     existing = {c.name for c in client.get_collections().collections}
     if COLLECTION_NAME in existing:
         return
+    # int8 scalar quantization keeps a 4x smaller copy of every vector in RAM for the search,
+    # and the deal_id keyword index serves the retriever's deal filter. Both take effect on a
+    # Qdrant server; local mode searches exhaustively and ignores them.
     client.create_collection(
         collection_name=COLLECTION_NAME,
         vectors_config=qm.VectorParams(size=vector_size, distance=qm.Distance.COSINE),
+        quantization_config=qm.ScalarQuantization(
+            scalar=qm.ScalarQuantizationConfig(type=qm.ScalarType.INT8, always_ram=True)
+        ),
+        hnsw_config=qm.HnswConfigDiff(on_disk=True),
     )
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="Payload indexes have no effect")
+        client.create_payload_index(
+            collection_name=COLLECTION_NAME, field_name="deal_id", field_schema=qm.PayloadSchemaType.KEYWORD
+        )
 
 def ingest_file_to_qdrant(
     *,
@@ -80,40 +217,60 @@ def ingest_file_to_qdrant(
     qdrant_path: Path,
     client: Optional[QdrantClient] = None,
 ) -> IngestResult:
+    content_hash = _file_hash(stored_path)
+    chunker = _chunker_id()
+    copies = _ingested_copies(content_hash, embed_model, chunker, deal_id, doc_id)
+    if copies:
+        if client is None:
+            client = get_qdrant_local_client(qdrant_path)
+        for source in copies:
+            if _reuse_points(client, source, deal_id, doc_id, filename):
+                _record_ingested(deal_id, doc_id, content_hash, embed_model, chunker, source[2])
+                return IngestResult(filename=filename, chunks_ingested=source[2])
+
     text = _extract_text_for_file(stored_path)
     chunks = _chunk_text(text)
 
     if not chunks:
+        _record_ingested(deal_id, doc_id, content_hash, embed_model, chunker, 0)
         return IngestResult(filename=filename, chunks_ingested=0)
 
-    # Embed first chunk to get vector size
-    v0 = embed_text(ollama_base_url, embed_model, chunks[0])
-    vector_size = len(v0)
-
-    if client is None:
-        client = get_qdrant_local_client(qdrant_path)
-
-    _ensure_collection(client, vector_size)
-
-    # Embed remaining chunks
-    vectors = [v0] + [embed_text(ollama_base_url, embed_model, c) for c in chunks[1:]]
-
-    points = []
-    for i, (vec, chunk_text) in enumerate(zip(vectors, chunks), start=1):
-        payload: Dict[str, Any] = {
-            "deal_id": deal_id,
-            "doc_id": doc_id,
-            "filename": filename,
-            "chunk_id": i,
-            "text": chunk_text,
-        }
-        points.append(
-            qm.PointStruct(
-                id=_point_id(deal_id, doc_id, i),
-                vector=vec,
-                payload=payload,
-            )
-        )
+    # Embed and upsert in batches, embedding the next batch while the current one is written
+    batches = [chunks[s:s + UPSERT_BATCH_SIZE] for s in range(0, len(chunks), UPSERT_BATCH_SIZE)]
+    ids = _point_ids(deal_id, doc_id, len(chunks))
+    ingested = 0
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="embed") as pool:
+        pending = pool.submit(_embed_cached, ollama_base_url, embed_model, batches[0])
+        for b, batch in enumerate(batches):
+            vectors = pending.result()
+            last = b == len(batches) - 1
+            if not last:
+                pending = pool.submit(_embed_cached, ollama_base_url, embed_model, batches[b + 1])
+            if b == 0:
+                # The first vector gives the collection size
+                if client is None:
+                    client = get_qdrant_local_client(qdrant_path)
+                _ensure_collection(client, len(vectors[0]))
 
-    client.upsert(collection_name=COLLECTION_NAME, points=points)
-    return IngestResult(filename=filename, chunks_ingested=len(points))
+            # One Batch (ids, vectors and payloads as parallel lists) per upsert; the client
+            # validates it far faster than the same points as PointStructs
+            first = b * UPSERT_BATCH_SIZE
+            payloads: List[Dict[str, Any]] = [
+                {
+                    "deal_id": deal_id,
+                    "doc_id": doc_id,
+                    "filename": filename,
+                    "chunk_id": first + j + 1,
+                    "text": chunk,
+                }
+                for j, chunk in enumerate(batch)
+            ]
+            points = qm.Batch(ids=ids[first:first + len(batch)], vectors=vectors, payloads=payloads)
+
+            # A Qdrant server applies a collection's updates in order, so waiting on the
+            # last batch waits for them all; local mode writes synchronously either way
+            client.upsert(collection_name=COLLECTION_NAME, points=points, wait=last)
+            ingested += len(batch)
+
+    _record_ingested(deal_id, doc_id, content_hash, embed_model, chunker, ingested)
+    return IngestResult(filename=filename, chunks_ingested=ingested)
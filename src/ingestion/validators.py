@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Iterable
 
-ALLOWED_EXTENSIONS = {".pdf", ".docx", ".pptx", ".xlsx", ".csv", ".zip"}
+ALLOWED_EXTENSIONS = frozenset({".pdf", ".docx", ".pptx", ".xlsx", ".csv", ".zip"})
 
 @dataclass(frozen=True)
 class ValidationResult:
@@ -13,8 +13,9 @@ class ValidationResult:
 def validate_filename(filename: str, allowed_exts: Iterable[str] = ALLOWED_EXTENSIONS) -> ValidationResult:
     if not filename or "." not in filename:
         return ValidationResult(False, "File has no extension.")
-    ext = "." + filename.split(".")[-1].lower()
-    if ext not in set(allowed_exts):
+    ext = "." + filename.rpartition(".")[2].lower()
+    allowed = allowed_exts if isinstance(allowed_exts, (set, frozenset)) else frozenset(allowed_exts)
+    if ext not in allowed:
         return ValidationResult(False, f"Unsupported file type: {ext}. Allowed: {sorted(allowed_exts)}")
     return ValidationResult(True, "")
 
@@ -1,6 +1,9 @@
 from __future__ import annotations
 import requests
 
+# Chat turns reuse one keep-alive connection instead of a new TCP handshake each
+SESSION = requests.Session()
+
 def ollama_chat(base_url: str, model: str, messages: list[dict], timeout_s: float = 120.0) -> str:
     """
     Uses Ollama /api/chat.
@@ -11,7 +14,7 @@ def ollama_chat(base_url: str, model: str, messages: list[dict], timeout_s: floa
         "messages": messages,
         "stream": False,
     }
-    r = requests.post(f"{base_url}/api/chat", json=payload, timeout=timeout_s)
+    r = SESSION.post(f"{base_url}/api/chat", json=payload, timeout=timeout_s)
     if r.status_code != 200:
         raise RuntimeError(f"Ollama chat failed HTTP {r.status_code}: {r.text[:200]}")
     data = r.json()
@@ -11,13 +11,15 @@ MONTH_DATE = re.compile(
 
 YEAR_ONLY = re.compile(r"\b(?:19|20)\d{2}\b")
 
+CITATION_CHAIN = re.compile(r"(\[\d+\])(?:\s*\[\d+\])+")
+
 def dedupe_inline_citations(text: str) -> str:
     """
     Collapses patterns like: [1][2][3] -> [1]
     and [1] [2] [3] -> [1]
     """
     # collapse adjacent citation chains
-    text = re.sub(r"(\[\d+\])(?:\s*\[\d+\])+", r"\1", text)
+    text = CITATION_CHAIN.sub(r"\1", text)
     return text
 
 def mask_unverified_dates(answer: str, context: str) -> str:
@@ -26,15 +28,20 @@ def mask_unverified_dates(answer: str, context: str) -> str:
     replace them with '[date not verified in excerpts]'.
     """
     ctx = context.lower()
+    # Whether a date occurs in the context is looked up once per distinct date. It stays a
+    # substring test: a year counts as verified when the context has it as e.g. "FY2020".
+    seen = {}
+
+    def verified(m: re.Match) -> bool:
+        key = m.group(0).lower()
+        if key not in seen:
+            seen[key] = key in ctx
+        return seen[key]
 
     # Mask full month-day-year dates not present in context
-    for m in set(MONTH_DATE.findall(answer)):
-        if m.lower() not in ctx:
-            answer = answer.replace(m, "[date not verified in excerpts]")
+    answer = MONTH_DATE.sub(lambda m: m.group(0) if verified(m) else "[date not verified in excerpts]", answer)
 
     # Mask standalone years that don't appear in context (conservative)
-    for y in set(YEAR_ONLY.findall(answer)):
-        if y.lower() not in ctx:
-            answer = re.sub(rf"\b{re.escape(y)}\b", "[year not verified in excerpts]", answer)
+    answer = YEAR_ONLY.sub(lambda m: m.group(0) if verified(m) else "[year not verified in excerpts]", answer)
 
     return answer
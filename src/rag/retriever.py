@@ -40,15 +40,21 @@ def retrieve_chunks(
     flt1 = qm.Filter(must=[qm.FieldCondition(key="deal_id", match=qm.MatchValue(value=deal_id))])
     pts = _query(client, query_vector, top_k, flt1)
 
-    # 2) If empty, try alternate key dealId
+    # 2) If empty, try alternate key dealId, and 3) query without filter for a client-side
+    # filter; both fallbacks go in one batch request. Usually (1) hits, so it is sent alone.
     if not pts:
         flt2 = qm.Filter(must=[qm.FieldCondition(key="dealId", match=qm.MatchValue(value=deal_id))])
-        pts = _query(client, query_vector, top_k, flt2)
+        alt, unfiltered = client.query_batch_points(
+            collection_name=COLLECTION_NAME,
+            requests=[
+                qm.QueryRequest(query=query_vector, limit=top_k, filter=flt2, with_payload=True),
+                qm.QueryRequest(query=query_vector, limit=50, with_payload=True),
+            ],
+        )
+        pts = alt.points
 
-    # 3) If still empty, query without filter and client-side filter
     if not pts:
-        pts_any = _query(client, query_vector, top_k=50, flt=None)
-        hits_any = _hits_from_points(pts_any)
+        hits_any = _hits_from_points(unfiltered.points)
         filtered = []
         for h in hits_any:
             pl = h.get("payload", {})
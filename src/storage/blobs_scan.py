@@ -1,4 +1,5 @@
 """Scanning blob storage for deal files"""
+import os
 from pathlib import Path
 from typing import List, Dict, Any
 
@@ -11,21 +12,22 @@ def list_deal_files(deal_id: str, storage_root: str = "storage") -> List[Dict[st
         return []
     
     files = []
-    for file_path in storage_path.iterdir():
-        if file_path.is_file():
-            # Parse the stored filename format: {doc_id}_{original_name}
-            filename = file_path.name
-            if '_' in filename:
-                doc_id, original_name = filename.split('_', 1)
-            else:
-                doc_id = filename[:8]  # fallback
-                original_name = filename
-            
-            files.append({
-                "doc_id": doc_id,
-                "original_name": original_name,
-                "stored_path": str(file_path),
-                "size_bytes": file_path.stat().st_size
-            })
+    # scandir's entries carry the file type, and stat() results are cached on the entry
+    with os.scandir(storage_path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                # Parse the stored filename format: {doc_id}_{original_name}
+                filename = entry.name
+                doc_id, sep, original_name = filename.partition('_')
+                if not sep:
+                    doc_id = filename[:8]  # fallback
+                    original_name = filename
+
+                files.append({
+                    "doc_id": doc_id,
+                    "original_name": original_name,
+                    "stored_path": entry.path,
+                    "size_bytes": entry.stat().st_size
+                })
     
     return files
@@ -1,21 +1,43 @@
 """Utilities for unpacking ZIP files"""
+import os
+import shutil
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 
+UNPACK_WORKERS = 4
+COPY_BUFFER_BYTES = 1024 * 1024
+
+
+def _member_path(extract_to: str, name: str) -> Path:
+    """Where zip_ref.extract would put `name`: drive, absolute and '..' parts are dropped, so nothing lands outside `extract_to`."""
+    name = name.replace("\\", "/")
+    parts = [p for p in name.split("/") if p not in ("", ".", "..")]
+    if parts:
+        parts[0] = os.path.splitdrive(parts[0])[1] or parts[0]
+    return Path(extract_to).joinpath(*parts)
+
 
 def unpack_zip(zip_path: str, extract_to: str) -> List[Dict[str, Any]]:
     """Unpack a ZIP file and return list of extracted files"""
-    extracted_files = []
-    
     with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        for file_info in zip_ref.infolist():
-            if not file_info.is_dir():
-                extracted_path = zip_ref.extract(file_info, extract_to)
-                extracted_files.append({
-                    "original_name": file_info.filename,
-                    "extracted_path": extracted_path,
-                    "size": file_info.file_size
-                })
-    
-    return extracted_files
+        infos = [info for info in zip_ref.infolist() if not info.is_dir()]
+
+        def extract(file_info: zipfile.ZipInfo) -> Dict[str, Any]:
+            # Members are streamed in 1 MiB blocks; decompression releases the GIL,
+            # so a few threads overlap inflating and writing
+            out = _member_path(extract_to, file_info.filename)
+            out.parent.mkdir(parents=True, exist_ok=True)
+            with zip_ref.open(file_info) as src, open(out, "wb") as dst:
+                shutil.copyfileobj(src, dst, length=COPY_BUFFER_BYTES)
+            return {
+                "original_name": file_info.filename,
+                "extracted_path": str(out),
+                "size": file_info.file_size
+            }
+
+        if len(infos) <= 1:
+            return [extract(info) for info in infos]
+        with ThreadPoolExecutor(max_workers=UNPACK_WORKERS) as pool:
+            return list(pool.map(extract, infos))